@@ -4,6 +4,7 @@ Re-exports configuration from gofr_common.config with GOFR_DOC prefix.
 """
 
 from pathlib import Path
+from typing import Optional
 
 from gofr_common.config import (
     Config as BaseConfig,
@@ -75,6 +76,16 @@ def get_default_images_dir() -> str:
     return os.environ.get("GOFR_DOC_IMAGES_DIR", str(_PROJECT_ROOT / "data" / "images"))
 
 
+def get_jinja_cache_dir() -> Optional[str]:
+    """Get the Jinja2 bytecode cache directory, if enabled.
+
+    Reads GOFR_DOC_JINJA_CACHE_DIR env var; returns None (cache disabled) when unset.
+    """
+    import os
+
+    return os.environ.get("GOFR_DOC_JINJA_CACHE_DIR") or None
+
+
 __all__ = [
     "Config",
     "Settings",
@@ -90,4 +101,5 @@ __all__ = [
     "get_default_sessions_dir",
     "get_default_proxy_dir",
     "get_default_images_dir",
+    "get_jinja_cache_dir",
 ]
@@ -134,7 +134,7 @@ def validate_configuration() -> tuple[bool, list[str]]:
         except ValueError:
             errors.append(f"{port_var}='{port_str}' is not a valid integer")
 
-    return len(errors) == 0, errors
+    return not errors, errors
 
 
 def print_configuration_help() -> None:
@@ -2,6 +2,8 @@
 
 from typing import List, Union, Dict, Any, Tuple
 
+_VALID_ORDERS = frozenset({"asc", "desc"})
+
 
 def _is_numeric(value: Any) -> bool:
     """
@@ -119,7 +121,7 @@ def sort_table_rows(
             col = spec["column"]
             order = spec.get("order", "asc").lower()
 
-            if order not in ["asc", "desc"]:
+            if order not in _VALID_ORDERS:
                 raise ValueError(f"Sort order must be 'asc' or 'desc', got '{order}'")
 
             is_desc = order == "desc"
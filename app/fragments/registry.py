@@ -3,7 +3,7 @@
 from typing import Dict, List, Optional
 
 from app.registries.base import BaseRegistry
-from app.validation.document_models import FragmentSchema, ParameterSchema
+from app.validation.document_models import FragmentSchema
 from app.logger import Logger
 from app.exceptions import FragmentNotFoundError, GroupMismatchError
 
@@ -87,18 +87,16 @@ class FragmentRegistry(BaseRegistry):
 
     def _build_fragment_schema(self, data: dict) -> FragmentSchema:
         """Build a FragmentSchema from loaded YAML data."""
-
-        # Build parameters
-        params = []
-        for param_data in data.get("parameters", []):
-            params.append(ParameterSchema(**param_data))
-
-        return FragmentSchema(
-            fragment_id=data.get("fragment_id", ""),
-            group=data.get("group", "public"),
-            name=data.get("name", ""),
-            description=data.get("description", ""),
-            parameters=params,
+        # Validate the raw parameter dicts with the schema in one pass rather
+        # than constructing each ParameterSchema separately
+        return FragmentSchema.model_validate(
+            {
+                "fragment_id": data.get("fragment_id", ""),
+                "group": data.get("group", "public"),
+                "name": data.get("name", ""),
+                "description": data.get("description", ""),
+                "parameters": data.get("parameters", []),
+            }
         )
 
     def list_fragments(self, group: Optional[str] = None) -> List[dict]:
@@ -109,7 +107,7 @@ class FragmentRegistry(BaseRegistry):
             group: Filter by specific group (None = all loaded groups)
         """
         if group:
-            if group not in self.groups:
+            if group not in self._groups_set:
                 return []
             # Filter by group
             items = [
@@ -133,6 +133,8 @@ if __name__ == "__main__":
         logger.info(f"API documentation: http://{args.host}:{args.port}/docs")
         logger.info(f"Health check: http://{args.host}:{args.port}/ping")
         logger.info("=" * 70)
+        # uvicorn's default loop/http "auto" settings select uvloop and
+        # httptools when installed (both are declared dependencies)
         uvicorn.run(server.app, host=args.host, port=args.port, log_level="info")
         logger.info("=" * 70)
         logger.info("Web server shutdown complete")
@@ -469,9 +469,9 @@ def list_groups(args):
             logger.info(f"{'Group':<20} {'Templates':<12} {'Fragments':<12} {'Styles'}")
             logger.info("-" * 60)
             for group in all_groups:
-                t_count = len(template_groups & {group})
-                f_count = len(fragment_groups & {group})
-                s_count = len(style_groups & {group})
+                t_count = int(group in template_groups)
+                f_count = int(group in fragment_groups)
+                s_count = int(group in style_groups)
                 logger.info(f"{group:<20} {t_count:<12} {f_count:<12} {s_count}")
         else:
             for group in all_groups:
@@ -12,8 +12,11 @@ app/mcp_server/mcp_server.py.
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Optional, Union
+import math
+from dataclasses import fields, is_dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import orjson
 from mcp.types import EmbeddedResource, ImageContent, TextContent
 from pydantic import ValidationError as PydanticValidationError
 
@@ -21,6 +24,29 @@ from app.validation.document_models import ErrorResponse
 
 ToolResponse = List[Union[TextContent, ImageContent, EmbeddedResource]]
 
+# orjson options matching json.dumps(indent=2, default=_json_serializer); datetimes
+# pass through to the serializer so they keep the str() form
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+# Dataclass type -> field names, computed once per class
+_FIELDS_CACHE: Dict[type, Tuple[str, ...]] = {}
+
+
+def _dataclass_field_names(cls: type) -> Tuple[str, ...]:
+    """Return (and cache) the field names of a dataclass type."""
+    names = _FIELDS_CACHE.get(cls)
+    if names is None:
+        names = tuple(f.name for f in fields(cls))
+        _FIELDS_CACHE[cls] = names
+    return names
+
+
+def _object_items(obj: Any) -> Any:
+    """Iterate (name, value) pairs of a dataclass (slotted or not) or plain object."""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return ((name, getattr(obj, name)) for name in _dataclass_field_names(type(obj)))
+    return obj.__dict__.items()
+
 
 def _json_serializer(obj: Any) -> Any:
     """Custom JSON serializer for non-standard types."""
@@ -28,17 +54,48 @@ def _json_serializer(obj: Any) -> Any:
     if hasattr(obj, "model_dump"):
         return obj.model_dump(mode="json")
     # Handle dataclasses and regular objects
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return dict(_object_items(obj))
     if hasattr(obj, "__dict__"):
         return obj.__dict__
     # Fallback
     return str(obj)
 
 
+def _has_non_finite(obj: Any) -> bool:
+    """Return True if a NaN or infinity appears anywhere in a response value."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(item) for item in obj)
+    if obj is None or isinstance(obj, (str, int)):
+        return False
+    converted = _json_serializer(obj)
+    return not isinstance(converted, str) and _has_non_finite(converted)
+
+
+def _json_dumps(payload: Dict[str, Any]) -> str:
+    """Serialize a response payload, using orjson when the output is plain ASCII.
+
+    The result parses to the same value as json.dumps output, but floats in
+    exponent form are written the shorter way (1e16 rather than 1e+16).
+    """
+    try:
+        encoded = orjson.dumps(payload, default=_json_serializer, option=_ORJSON_OPTIONS)
+    except orjson.JSONEncodeError:
+        encoded = None
+    # orjson writes NaN/Infinity as null; only payloads with a null can hold one
+    if encoded is not None and encoded.isascii():
+        if b"null" not in encoded or not _has_non_finite(payload):
+            return encoded.decode("ascii")
+    # Non-ASCII text needs json's \u escaping; oversized ints, NaN etc. also land here
+    return json.dumps(payload, indent=2, ensure_ascii=True, default=_json_serializer)
+
+
 def _json_text(payload: Dict[str, Any]) -> TextContent:
-    return TextContent(
-        type="text",
-        text=json.dumps(payload, indent=2, ensure_ascii=True, default=_json_serializer),
-    )
+    return TextContent(type="text", text=_json_dumps(payload))
 
 
 def _success(data: Any, message: Optional[str] = None) -> ToolResponse:
@@ -69,12 +126,17 @@ def _handle_validation_error(exc: PydanticValidationError) -> ToolResponse:
     missing_fields = [e["loc"][0] for e in errors if e["type"] == "missing"]
     invalid_types = [e["loc"][0] for e in errors if "type" in e["type"]]
 
-    recovery_msg = "Input validation failed. "
+    recovery_parts = ["Input validation failed. "]
     if missing_fields:
-        recovery_msg += f"MISSING REQUIRED FIELDS: {', '.join(str(f) for f in missing_fields)}. "
+        recovery_parts.append(
+            f"MISSING REQUIRED FIELDS: {', '.join(str(f) for f in missing_fields)}. "
+        )
     if invalid_types:
-        recovery_msg += f"INCORRECT TYPES: {', '.join(str(f) for f in invalid_types)}. "
-    recovery_msg += "Check the tool's inputSchema for required parameters and their types. Review the 'details' field below for specific errors, correct your input, and retry."
+        recovery_parts.append(f"INCORRECT TYPES: {', '.join(str(f) for f in invalid_types)}. ")
+    recovery_parts.append(
+        "Check the tool's inputSchema for required parameters and their types. Review the 'details' field below for specific errors, correct your input, and retry."
+    )
+    recovery_msg = "".join(recovery_parts)
 
     return _error(
         code="INVALID_ARGUMENTS",
@@ -88,10 +150,10 @@ def _model_dump(model: Any) -> Dict[str, Any]:
     """Convert model to dictionary, supporting Pydantic models and dataclasses."""
     if hasattr(model, "model_dump"):
         return model.model_dump(mode="json")
-    # Handle regular dataclasses and objects with __dict__
-    if hasattr(model, "__dict__"):
+    # Handle dataclasses (including slotted ones) and objects with __dict__
+    if (is_dataclass(model) and not isinstance(model, type)) or hasattr(model, "__dict__"):
         result: Dict[str, Any] = {}
-        for key, value in model.__dict__.items():
+        for key, value in _object_items(model):
             if hasattr(value, "model_dump"):
                 # Nested Pydantic model
                 result[key] = value.model_dump(mode="json")
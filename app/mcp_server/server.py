@@ -28,7 +28,12 @@ async def lifespan(starlette_app) -> AsyncIterator[None]:
     await initialize_server()
     async with session_manager_http.run():
         logger.info("StreamableHTTP session manager ready")
-        yield
+        try:
+            yield
+        finally:
+            from app.validation.image_validator import close_image_client
+
+            await close_image_client()
 
 
 from gofr_common.web import (  # noqa: E402 - must import after MCP setup
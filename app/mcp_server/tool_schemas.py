@@ -9,12 +9,24 @@ app/mcp_server/mcp_server.py.
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional
 
 from mcp.types import Tool
 
+# Tool definitions are static; built on the first list_tools request and reused
+_TOOLS: Optional[List[Tool]] = None
+
 
 async def build_tools() -> List[Tool]:
+    global _TOOLS
+
+    if _TOOLS is None:
+        _TOOLS = _build_tools()
+    # Fresh list so callers can't reorder or extend the cached one
+    return list(_TOOLS)
+
+
+def _build_tools() -> List[Tool]:
     return [
         Tool(
             name="ping",
@@ -80,7 +80,7 @@ async def _tool_list_template_fragments(arguments: Dict[str, Any]) -> ToolRespon
         )
 
     fragments = [
-        FragmentListItem(
+        FragmentListItem.model_construct(
             fragment_id=fragment.fragment_id,
             name=fragment.name,
             description=fragment.description,
@@ -124,12 +124,13 @@ async def _tool_get_fragment_details(arguments: Dict[str, Any]) -> ToolResponse:
                 ),
             )
 
-    details = FragmentDetailsOutput(
+    # Built from the registry's validated schema, so skip re-validation
+    details = FragmentDetailsOutput.model_construct(
         template_id=payload.template_id,
         fragment_id=fragment_schema.fragment_id,
         name=fragment_schema.name,
         description=fragment_schema.description,
-        parameters=fragment_schema.parameters,
+        parameters=tuple(fragment_schema.parameters),
     )
     return _success(_model_dump(details))
 
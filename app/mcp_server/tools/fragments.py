@@ -35,7 +35,7 @@ async def _tool_set_global_parameters(arguments: Dict[str, Any]) -> ToolResponse
     """
     payload = SetGlobalParametersInput.model_validate(arguments)
     manager = ensure_manager()
-    caller_group = payload.group if hasattr(payload, "group") else "public"
+    caller_group = payload.group
 
     # Resolve alias to GUID if needed
     session_id = resolve_session_identifier(payload.session_id, caller_group, manager)
@@ -80,7 +80,7 @@ async def _tool_add_fragment(arguments: Dict[str, Any]) -> ToolResponse:
     """
     payload = AddFragmentInput.model_validate(arguments)
     manager = ensure_manager()
-    caller_group = payload.group if hasattr(payload, "group") else "public"
+    caller_group = payload.group
 
     # Resolve alias to GUID if needed
     session_id = resolve_session_identifier(payload.session_id, caller_group, manager)
@@ -135,7 +135,7 @@ async def _tool_add_image_fragment(arguments: Dict[str, Any]) -> ToolResponse:
     # Parse and validate input
     payload = AddImageFragmentInput.model_validate(arguments)
     manager = ensure_manager()
-    caller_group = payload.group if hasattr(payload, "group") else "public"
+    caller_group = payload.group
 
     # Resolve alias to GUID if needed
     session_id = resolve_session_identifier(payload.session_id, caller_group, manager)
@@ -219,7 +219,7 @@ async def _tool_add_image_fragment(arguments: Dict[str, Any]) -> ToolResponse:
         fragment_parameters["height"] = payload.height
 
     fragment_parameters["alt_text"] = payload.alt_text or payload.title or "Image"
-    fragment_parameters["alignment"] = payload.alignment or "center"
+    fragment_parameters["alignment"] = payload.alignment
     fragment_parameters["require_https"] = payload.require_https
 
     # Add fragment to session using standard fragment_id
@@ -247,7 +247,7 @@ async def _tool_remove_fragment(arguments: Dict[str, Any]) -> ToolResponse:
     """
     payload = RemoveFragmentInput.model_validate(arguments)
     manager = ensure_manager()
-    caller_group = payload.group if hasattr(payload, "group") else "public"
+    caller_group = payload.group
 
     # Resolve alias to GUID if needed
     session_id = resolve_session_identifier(payload.session_id, caller_group, manager)
@@ -295,7 +295,7 @@ async def _tool_list_session_fragments(arguments: Dict[str, Any]) -> ToolRespons
     """
     payload = ListSessionFragmentsInput.model_validate(arguments)
     manager = ensure_manager()
-    caller_group = payload.group if hasattr(payload, "group") else "public"
+    caller_group = payload.group
 
     # Resolve alias to GUID if needed
     session_id = resolve_session_identifier(payload.session_id, caller_group, manager)
@@ -21,6 +21,11 @@ from app.validation.plot_models import (
 
 logger: Logger = session_logger
 
+# RenderGraphInput fields that GraphParams takes (everything but the auth context)
+_RENDER_GRAPH_FIELDS = tuple(
+    name for name in RenderGraphInput.model_fields if name not in ("auth_token", "token", "group")
+)
+
 
 async def _tool_render_graph(arguments: Dict[str, Any]) -> ToolResponse:
     """Render a graph visualization.
@@ -34,7 +39,7 @@ async def _tool_render_graph(arguments: Dict[str, Any]) -> ToolResponse:
     import base64 as b64_mod
 
     payload = RenderGraphInput.model_validate(arguments)
-    caller_group = payload.group if hasattr(payload, "group") else "public"
+    caller_group = payload.group
 
     comps = get_components()
     renderer = None if comps is None else comps.plot_renderer
@@ -48,15 +53,18 @@ async def _tool_render_graph(arguments: Dict[str, Any]) -> ToolResponse:
     storage = None if comps is None else comps.plot_storage
     validator = None if comps is None else comps.plot_validator
 
-    # Build GraphParams from validated input (exclude auth/group fields)
+    # Build GraphParams from validated input (exclude auth/group fields). Read the
+    # attributes directly: model_dump would copy every data series.
     param_fields = {
-        k: v
-        for k, v in payload.model_dump().items()
-        if k not in ("auth_token", "token", "group") and v is not None
+        name: value
+        for name in _RENDER_GRAPH_FIELDS
+        if (value := getattr(payload, name)) is not None
     }
 
     try:
-        graph_data = GraphParams(**param_fields)
+        # Fields were already validated with the same types by RenderGraphInput;
+        # model_construct still runs model_post_init (y -> y1 mapping, dataset check)
+        graph_data = GraphParams.model_construct(**param_fields)
     except (ValueError, Exception) as e:
         return _error(
             code="INVALID_GRAPH_PARAMS",
@@ -71,7 +79,7 @@ async def _tool_render_graph(arguments: Dict[str, Any]) -> ToolResponse:
     if validator is not None:
         validation_result = validator.validate(graph_data)
         if not validation_result.is_valid:
-            error_details = [err.to_dict() for err in validation_result.errors]
+            error_details = validation_result.get_json_errors()
             return _error(
                 code="GRAPH_VALIDATION_ERROR",
                 message="Graph data validation failed",
@@ -187,7 +195,7 @@ async def _tool_get_image(arguments: Dict[str, Any]) -> ToolResponse:
     import base64 as b64_mod
 
     payload = GetImageInput.model_validate(arguments)
-    caller_group = payload.group if hasattr(payload, "group") else "public"
+    caller_group = payload.group
 
     comps = get_components()
     storage = None if comps is None else comps.plot_storage
@@ -249,7 +257,7 @@ async def _tool_get_image(arguments: Dict[str, Any]) -> ToolResponse:
 async def _tool_list_images(arguments: Dict[str, Any]) -> ToolResponse:
     """List all stored plot images accessible to the caller's group."""
     payload = ListImagesInput.model_validate(arguments)
-    caller_group = payload.group if hasattr(payload, "group") else "public"
+    caller_group = payload.group
 
     comps = get_components()
     storage = None if comps is None else comps.plot_storage
@@ -312,7 +320,7 @@ async def _tool_add_plot_fragment(arguments: Dict[str, Any]) -> ToolResponse:
 
     payload = AddPlotFragmentInput.model_validate(arguments)
     manager = ensure_manager()
-    caller_group = payload.group if hasattr(payload, "group") else "public"
+    caller_group = payload.group
 
     # Resolve session alias to GUID if needed
     session_id = resolve_session_identifier(payload.session_id, caller_group, manager)
@@ -429,7 +437,8 @@ async def _tool_add_plot_fragment(arguments: Dict[str, Any]) -> ToolResponse:
                 render_fields[field_name] = val
 
         try:
-            graph_data = GraphParams(**render_fields)
+            # Already validated by AddPlotFragmentInput; see _tool_render_graph
+            graph_data = GraphParams.model_construct(**render_fields)
         except (ValueError, Exception) as e:
             return _error(
                 code="INVALID_GRAPH_PARAMS",
@@ -442,7 +451,7 @@ async def _tool_add_plot_fragment(arguments: Dict[str, Any]) -> ToolResponse:
         if validator is not None:
             validation_result = validator.validate(graph_data)
             if not validation_result.is_valid:
-                error_details = [err.to_dict() for err in validation_result.errors]
+                error_details = validation_result.get_json_errors()
                 return _error(
                     code="GRAPH_VALIDATION_ERROR",
                     message="Graph data validation failed",
@@ -493,7 +502,7 @@ async def _tool_add_plot_fragment(arguments: Dict[str, Any]) -> ToolResponse:
         fragment_parameters["height"] = payload.height
 
     fragment_parameters["alt_text"] = payload.alt_text or image_title or "Plot"
-    fragment_parameters["alignment"] = payload.alignment or "center"
+    fragment_parameters["alignment"] = payload.alignment
 
     # Add fragment to session using standard image fragment
     output = await manager.add_fragment(
@@ -11,7 +11,7 @@ from app.mcp_server.responses import _error, _model_dump, _success
 from app.mcp_server.state import ensure_manager, ensure_renderer
 from app.mcp_server.tool_types import ToolResponse
 from app.mcp_server.tools.common import resolve_session_identifier
-from app.validation.document_models import GetDocumentInput, OutputFormat
+from app.validation.document_models import GetDocumentInput, parse_output_format
 
 logger: Logger = session_logger
 
@@ -20,7 +20,7 @@ async def _tool_get_document(arguments: Dict[str, Any]) -> ToolResponse:
     payload = GetDocumentInput.model_validate(arguments)
     manager = ensure_manager()
     renderer = ensure_renderer()
-    caller_group = payload.group if hasattr(payload, "group") else "public"
+    caller_group = payload.group
 
     # Resolve alias to GUID if needed
     session_id = resolve_session_identifier(payload.session_id, caller_group, manager)
@@ -75,14 +75,9 @@ async def _tool_get_document(arguments: Dict[str, Any]) -> ToolResponse:
         )
 
     try:
-        # Convert 'md' alias to 'markdown' for OutputFormat enum
-        format_value = payload.format
-        if format_value == "md":
-            format_value = "markdown"
-
         output = await renderer.render_document(
             session=session,
-            output_format=OutputFormat(format_value),
+            output_format=parse_output_format(payload.format),
             style_id=payload.style_id,
             proxy=payload.proxy,
         )
@@ -95,10 +90,12 @@ async def _tool_get_document(arguments: Dict[str, Any]) -> ToolResponse:
                 web_server_host = runtime_settings.web_url_override or os.getenv(
                     "DOCO_WEB_URL", "http://localhost:8012"
                 )
-                output.download_url = f"{web_server_host}/proxy/{output.proxy_guid}"
+                output = output.model_copy(
+                    update={"download_url": f"{web_server_host}/proxy/{output.proxy_guid}"}
+                )
             elif runtime_settings.proxy_url_mode == "guid":
                 # In guid-only mode, clear download_url to return just the GUID
-                output.download_url = None
+                output = output.model_copy(update={"download_url": None})
 
     except ValueError as exc:
         logger.warning("Rendering failed", error=str(exc))
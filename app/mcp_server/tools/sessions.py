@@ -26,7 +26,7 @@ async def _tool_get_session_status(arguments: Dict[str, Any]) -> ToolResponse:
 
     payload = GetSessionStatusInput.model_validate(arguments)
     manager = ensure_manager()
-    caller_group = payload.group if hasattr(payload, "group") else "public"
+    caller_group = payload.group
 
     # Resolve alias to GUID if needed
     session_id = resolve_session_identifier(payload.session_id, caller_group, manager)
@@ -83,16 +83,17 @@ async def _tool_list_active_sessions(arguments: Dict[str, Any]) -> ToolResponse:
 
     payload = ListActiveSessionsInput.model_validate(arguments)
     manager = ensure_manager()
-    caller_group = payload.group if hasattr(payload, "group") else "public"
+    caller_group = payload.group
 
     # SECURITY: Only return sessions from caller's group
     all_sessions_output = await manager.list_active_sessions()
     filtered_sessions = [s for s in all_sessions_output.sessions if s.group == caller_group]
 
-    all_sessions_output.sessions = filtered_sessions
-    all_sessions_output.session_count = len(filtered_sessions)
+    filtered_output = all_sessions_output.model_copy(
+        update={"sessions": filtered_sessions, "session_count": len(filtered_sessions)}
+    )
 
-    return _success(_model_dump(all_sessions_output))
+    return _success(_model_dump(filtered_output))
 
 
 async def _tool_abort_session(arguments: Dict[str, Any]) -> ToolResponse:
@@ -110,7 +111,7 @@ async def _tool_abort_session(arguments: Dict[str, Any]) -> ToolResponse:
     """
     payload = AbortDocumentSessionInput.model_validate(arguments)
     manager = ensure_manager()
-    caller_group = payload.group if hasattr(payload, "group") else "public"
+    caller_group = payload.group
 
     # Resolve alias to GUID if needed
     session_id = resolve_session_identifier(payload.session_id, caller_group, manager)
@@ -16,7 +16,7 @@ async def _tool_validate_parameters(arguments: Dict[str, Any]) -> ToolResponse:
     payload = ValidateParametersInput.model_validate(arguments)
     manager = ensure_manager()
     registry = ensure_template_registry()
-    caller_group = payload.group if hasattr(payload, "group") else "public"
+    caller_group = payload.group
 
     # SECURITY: Verify template exists in caller's group
     template_schema = registry.get_template_schema(payload.template_id)
@@ -4,7 +4,7 @@ Validates GraphParams with helpful error messages and suggestions.
 Stripped of gofr-plot's Sanitizer dependency -- validation only.
 """
 
-from typing import List
+from typing import List, Sequence
 
 from app.plot.graph_params import GraphParams
 from app.plot.themes import list_themes
@@ -40,17 +40,31 @@ class ValidationError:
 class ValidationResult:
     """Result of graph data validation."""
 
-    def __init__(self, is_valid: bool, errors: List[ValidationError] | None = None):
+    __slots__ = ("is_valid", "errors")
+
+    def __init__(self, is_valid: bool, errors: Sequence[ValidationError] | None = None):
         self.is_valid = is_valid
-        self.errors = errors or []
+        self.errors = [] if errors is None else errors
+
+    def get_json_errors(self) -> List[dict]:
+        """Return all errors as JSON-ready dicts for tool error responses."""
+        return [err.to_dict() for err in self.errors]
+
+
+# Shared result for the common no-error case; the empty tuple keeps it immutable
+_VALID_RESULT = ValidationResult(is_valid=True, errors=())
 
 
 class GraphDataValidator:
     """Validates GraphParams with helpful error messages and suggestions."""
 
+    # Tuples keep the order shown in error messages; sets back the lookups
+    valid_types = ("line", "scatter", "bar")
+    valid_formats = ("png", "jpg", "svg", "pdf")
+    _VALID_TYPES = frozenset(valid_types)
+    _VALID_FORMATS = frozenset(valid_formats)
+
     def __init__(self):
-        self.valid_types = ["line", "scatter", "bar"]
-        self.valid_formats = ["png", "jpg", "svg", "pdf"]
         self.valid_themes = list_themes()
 
     def validate(self, data: GraphParams) -> ValidationResult:
@@ -64,7 +78,9 @@ class GraphDataValidator:
         errors.extend(self._validate_numeric_ranges(data))
         errors.extend(self._validate_colors(data))
 
-        return ValidationResult(is_valid=len(errors) == 0, errors=errors)
+        if not errors:
+            return _VALID_RESULT
+        return ValidationResult(is_valid=False, errors=errors)
 
     def _validate_arrays(self, data: GraphParams) -> List[ValidationError]:
         errors = []
@@ -138,7 +154,7 @@ class GraphDataValidator:
 
     def _validate_type(self, data: GraphParams) -> List[ValidationError]:
         errors = []
-        if data.type not in self.valid_types:
+        if data.type not in self._VALID_TYPES:
             errors.append(
                 ValidationError(
                     field="type",
@@ -156,7 +172,7 @@ class GraphDataValidator:
 
     def _validate_format(self, data: GraphParams) -> List[ValidationError]:
         errors = []
-        if data.format not in self.valid_formats:
+        if data.format not in self._VALID_FORMATS:
             errors.append(
                 ValidationError(
                     field="format",
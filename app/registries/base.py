@@ -1,12 +1,27 @@
 """Base registry for template and fragment management."""
 
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, List
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from typing import Dict, FrozenSet, Optional, List, Tuple
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    select_autoescape,
+)
 import yaml
 from app.logger import Logger
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one when
+# PyYAML was built without libyaml.
+try:
+    from yaml import CSafeLoader as SafeYamlLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as SafeYamlLoader  # type: ignore[assignment]
+
 
 class BaseRegistry(ABC):
     """Abstract base for registries managing schema + Jinja2 templates."""
@@ -32,6 +47,7 @@ class BaseRegistry(ABC):
 
         # Determine which groups to load
         self.groups = self._resolve_groups(group, groups)
+        self._groups_set = frozenset(self.groups)
 
         self._jinja_env: Optional[Environment] = None
         self._setup_jinja_env()
@@ -78,17 +94,41 @@ class BaseRegistry(ABC):
         return sorted(groups) if groups else ["public"]
 
     def _setup_jinja_env(self) -> None:
-        """Setup Jinja2 environment for template rendering."""
+        """Setup Jinja2 environment for template rendering.
+
+        Template sources are fixed once the registry is loaded, so auto_reload is
+        disabled to avoid an mtime stat on every template lookup. When
+        GOFR_DOC_JINJA_CACHE_DIR is set, compiled templates are also cached to
+        disk so warm starts skip re-parsing.
+        """
         self._jinja_env = Environment(
             loader=FileSystemLoader(str(self.registry_dir)),
             autoescape=select_autoescape(["html", "xml"]),
             trim_blocks=True,
             lstrip_blocks=True,
+            auto_reload=False,
+            cache_size=400,
+            bytecode_cache=self._create_bytecode_cache(),
         )
 
         # Register custom filters
         self._register_custom_filters()
 
+    def _create_bytecode_cache(self) -> Optional[BytecodeCache]:
+        """Create a filesystem bytecode cache if one is configured."""
+        from app.config import get_jinja_cache_dir
+
+        cache_dir = get_jinja_cache_dir()
+        if not cache_dir:
+            return None
+
+        try:
+            Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            self.logger.warning(f"Jinja bytecode cache disabled, cannot create {cache_dir}: {e}")
+            return None
+        return FileSystemBytecodeCache(directory=cache_dir, pattern="__jinja2_%s.cache")
+
     def _register_custom_filters(self) -> None:
         """Register custom Jinja2 filters."""
         if self._jinja_env is None:
@@ -130,11 +170,32 @@ class BaseRegistry(ABC):
         """Load and parse a YAML file."""
         try:
             with open(file_path, "r") as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=SafeYamlLoader)
         except Exception as e:
             self.logger.error(f"Failed to parse YAML {file_path}: {e}")
             return None
 
+    def _load_yaml_files(self, file_paths: List[Path]) -> List[Optional[Dict]]:
+        """
+        Load and parse several YAML files concurrently.
+
+        File reads are I/O bound and independent, so they are spread across a
+        small thread pool. Results are returned in the same order as file_paths;
+        entries are None for files that failed to parse.
+
+        Args:
+            file_paths: Paths of the YAML files to load
+
+        Returns:
+            Parsed documents, one per input path
+        """
+        if len(file_paths) <= 1:
+            return [self._load_yaml_file(path) for path in file_paths]
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(file_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._load_yaml_file, file_paths))
+
     def _validate_group_match(
         self, expected_group: str, actual_group: str, item_id: str, item_type: str, file_path: str
     ) -> None:
@@ -176,8 +237,28 @@ class BaseRegistry(ABC):
             raise RuntimeError("Jinja environment not initialized")
         return self._jinja_env.get_template(template_path)
 
+    @staticmethod
+    def _build_parameter_index(parameter_schemas: List) -> Tuple[Tuple, FrozenSet[str]]:
+        """
+        Precompute the lookup data used to validate against a parameter list.
+
+        Args:
+            parameter_schemas: List of ParameterSchema objects
+
+        Returns:
+            Tuple of (required parameter schemas, frozenset of all parameter names)
+        """
+        return (
+            tuple(p for p in parameter_schemas if p.required),
+            frozenset(p.name for p in parameter_schemas),
+        )
+
     def _validate_parameters_against_schema(
-        self, parameters: Dict, parameter_schemas: List, context: str
+        self,
+        parameters: Dict,
+        parameter_schemas: List,
+        context: str,
+        parameter_index: Optional[Tuple[Tuple, FrozenSet[str]]] = None,
     ) -> tuple[bool, List[str]]:
         """
         Validate parameters against a list of parameter schemas.
@@ -190,28 +271,30 @@ class BaseRegistry(ABC):
             parameters: Dictionary of parameter values to validate
             parameter_schemas: List of ParameterSchema objects defining expected parameters
             context: Contextual description for error messages (e.g., "template 'basic_report'" or "fragment 'paragraph'")
+            parameter_index: Optional result of _build_parameter_index for parameter_schemas,
+                precomputed by registries that validate the same schema repeatedly
 
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        errors = []
-        provided_params = set(parameters.keys())
+        if parameter_index is None:
+            parameter_index = self._build_parameter_index(parameter_schemas)
+        required_params, expected_params = parameter_index
 
         # Check required parameters
-        for param_schema in parameter_schemas:
-            if param_schema.required and param_schema.name not in parameters:
-                errors.append(
-                    f"Missing required parameter '{param_schema.name}' "
-                    f"for {context} ({param_schema.description})"
-                )
+        errors = [
+            f"Missing required parameter '{param_schema.name}' "
+            f"for {context} ({param_schema.description})"
+            for param_schema in required_params
+            if param_schema.name not in parameters
+        ]
 
         # Check for unexpected parameters
-        expected_params = {p.name for p in parameter_schemas}
-        unexpected = provided_params - expected_params
+        unexpected = parameters.keys() - expected_params
         if unexpected:
             errors.append(
                 f"Unexpected parameters for {context}: {', '.join(unexpected)}. "
                 f"Expected: {', '.join(expected_params)}"
             )
 
-        return len(errors) == 0, errors
+        return not errors, errors
@@ -1,19 +1,21 @@
 """Rendering engine for document generation."""
 
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
 from datetime import datetime
+import hashlib
 import html2text
+import orjson
 from weasyprint import HTML
-from io import BytesIO
 import base64
 import uuid
 
 from app.validation.document_models import (
     DocumentSession,
     OutputFormat,
+    parse_output_format,
     GetDocumentOutput,
     GetProxyDocumentOutput,
-    FragmentInstance,
 )
 from app.templates.registry import TemplateRegistry
 from app.styles.registry import StyleRegistry
@@ -23,6 +25,20 @@ from app.formatting.number_formatter import format_number
 from app.formatting.table_sorter import sort_table_rows
 from app.validation.color_validator import get_css_color
 
+# OutputFormat member -> stored string value, looked up once per proxy write
+_FORMAT_VALUES = {fmt: fmt.value for fmt in OutputFormat}
+
+# Rendered documents kept per engine; entries can be multi-MB PDFs, so this is
+# deliberately small
+_RENDER_CACHE_SIZE = 64
+
+_CANONICAL_JSON = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def _digest(value: Any) -> bytes:
+    """Hash a JSON-compatible value independently of dict key order."""
+    return hashlib.blake2b(orjson.dumps(value, option=_CANONICAL_JSON), digest_size=16).digest()
+
 
 class RenderingEngine:
     """Handles document rendering to HTML, PDF, and Markdown."""
@@ -47,8 +63,34 @@ class RenderingEngine:
         self.style_registry = style_registry
         self.logger = logger
         self.proxy_dir = proxy_dir or get_default_proxy_dir()
+        # Rendered content keyed by _render_cache_key, least recently used first
+        self._render_cache: "OrderedDict[Tuple[Any, ...], str]" = OrderedDict()
         self._register_jinja_filters()
 
+    def _render_cache_key(
+        self, session: DocumentSession, output_format: OutputFormat, style_id: str
+    ) -> Optional[Tuple[Any, ...]]:
+        """Build the render cache key from everything the output depends on.
+
+        Returns None when the parameters cannot be serialized canonically, in
+        which case the render is not cached.
+        """
+        try:
+            parameters_digest = _digest(session.global_parameters)
+            fragments_digest = _digest(
+                [(fragment.fragment_id, fragment.parameters) for fragment in session.fragments]
+            )
+        except TypeError:
+            return None
+        return (
+            session.template_id,
+            session.group,
+            style_id,
+            output_format,
+            parameters_digest,
+            fragments_digest,
+        )
+
     def _register_jinja_filters(self):
         """Register custom Jinja filters for template rendering."""
         # Get the Jinja environment from template registry
@@ -109,18 +151,30 @@ class RenderingEngine:
         if not self.style_registry.style_exists(style_id):
             raise ValueError(f"Style '{style_id}' not found in group '{session.group}'")
 
-        # Generate HTML
-        html_content = await self._render_html(session, style_id)
-
-        # Convert to requested format
-        if output_format == OutputFormat.HTML:
-            content = html_content
-        elif output_format == OutputFormat.PDF:
-            content = await self._html_to_pdf(html_content, style_id)
-        elif output_format == OutputFormat.MD:
-            content = await self._html_to_markdown(html_content, session)
+        # Identical session content, style and format render identically
+        cache_key = self._render_cache_key(session, output_format, style_id)
+        content = self._render_cache.get(cache_key) if cache_key is not None else None
+        if content is not None:
+            self._render_cache.move_to_end(cache_key)
+            self.logger.debug(f"Render cache hit for session {session.session_id}")
         else:
-            raise ValueError(f"Unsupported output format: {output_format}")
+            # Generate HTML
+            html_content = await self._render_html(session, style_id)
+
+            # Convert to requested format
+            if output_format == OutputFormat.HTML:
+                content = html_content
+            elif output_format == OutputFormat.PDF:
+                content = await self._html_to_pdf(html_content, style_id)
+            elif output_format == OutputFormat.MD:
+                content = await self._html_to_markdown(html_content, session)
+            else:
+                raise ValueError(f"Unsupported output format: {output_format}")
+
+            if cache_key is not None:
+                self._render_cache[cache_key] = content
+                if len(self._render_cache) > _RENDER_CACHE_SIZE:
+                    self._render_cache.popitem(last=False)
 
         self.logger.info(
             f"Rendered session {session.session_id} to {output_format.value} "
@@ -134,7 +188,8 @@ class RenderingEngine:
             # Return empty content with proxy_guid instead
             content = ""
 
-        return GetDocumentOutput(
+        # Every field comes from this render, so skip re-validation
+        return GetDocumentOutput.model_construct(
             session_id=session.session_id,
             format=output_format,
             style_id=style_id,
@@ -163,14 +218,16 @@ class RenderingEngine:
         css_content = self.style_registry.get_style_css(style_id)
 
         # Render fragments
-        rendered_fragments = []
-        for fragment_instance in session.fragments:
-            if isinstance(fragment_instance, FragmentInstance):
-                fragment_html = await self._render_fragment(
+        # DocumentSession validation guarantees every entry is a FragmentInstance.
+        # Wrap in dict to match template expectations (template expects fragment.html)
+        rendered_fragments = [
+            {
+                "html": await self._render_fragment(
                     session.template_id, fragment_instance.fragment_id, fragment_instance.parameters
                 )
-                # Wrap in dict to match template expectations (template expects fragment.html)
-                rendered_fragments.append({"html": fragment_html})
+            }
+            for fragment_instance in session.fragments
+        ]
 
         # Render main document
         # Unpack global_parameters to top-level template variables (title, author, etc.)
@@ -220,13 +277,12 @@ class RenderingEngine:
             Base64-encoded PDF content
         """
         try:
-            # Create PDF in memory
-            pdf_bytes = BytesIO()
-            HTML(string=html_content).write_pdf(pdf_bytes)
-            pdf_bytes.seek(0)
+            # With no target, write_pdf returns the bytes directly; this avoids
+            # a BytesIO buffer plus a full read() copy of every rendered PDF
+            pdf_bytes = HTML(string=html_content).write_pdf()
 
             # Encode as base64 for text transmission
-            pdf_base64 = base64.b64encode(pdf_bytes.read()).decode("utf-8")
+            pdf_base64 = base64.b64encode(pdf_bytes).decode("ascii")
 
             self.logger.info(f"Converted HTML to PDF (style: {style_id})")
             return pdf_base64
@@ -369,9 +425,7 @@ class RenderingEngine:
         proxy_file = group_dir / f"{proxy_guid}.json"
         proxy_data = {
             "proxy_guid": proxy_guid,
-            "format": (
-                output_format.value if isinstance(output_format, OutputFormat) else output_format
-            ),
+            "format": _FORMAT_VALUES.get(output_format, output_format),
             "content": content,
             "group": group,  # Store group ownership for verification on retrieval
             "created_at": datetime.utcnow().isoformat() + "Z",
@@ -430,7 +484,7 @@ class RenderingEngine:
 
             return GetProxyDocumentOutput(
                 proxy_guid=proxy_guid,
-                format=OutputFormat(proxy_data["format"]),
+                format=parse_output_format(proxy_data["format"]),
                 content=proxy_data["content"],
                 group=stored_group,  # Include stored group for verification
                 message="Proxy document retrieved successfully",
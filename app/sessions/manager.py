@@ -1,6 +1,7 @@
 """Session manager for document generation sessions."""
 
 import re
+import sys
 import uuid
 from datetime import datetime
 from typing import Dict, Optional
@@ -24,6 +25,9 @@ from app.validation.document_models import (
     SetGlobalParametersOutput,
 )
 
+# Index offset from the reference fragment for relative insert positions
+_RELATIVE_POSITION_OFFSETS = {"before": 0, "after": 1}
+
 
 class SessionManager:
     """Manages document generation sessions with persistent storage."""
@@ -208,10 +212,12 @@ class SessionManager:
         session_id = str(uuid.uuid4())
         now = datetime.utcnow().isoformat()
 
-        session = DocumentSession(
+        # Every field is server-generated or already checked above, so skip
+        # revalidation; intern the lookup keys as the model validator would
+        session = DocumentSession.model_construct(
             session_id=session_id,
-            template_id=template_id,
-            group=group,
+            template_id=sys.intern(template_id),
+            group=sys.intern(group),
             alias=alias,
             global_parameters={},
             fragments=[],
@@ -229,7 +235,7 @@ class SessionManager:
             f"Created session {session_id} (alias: {alias}) with template {template_id}"
         )
 
-        return CreateSessionOutput(
+        return CreateSessionOutput.model_construct(
             session_id=session_id, alias=alias, template_id=template_id, created_at=now
         )
 
@@ -285,7 +291,7 @@ class SessionManager:
 
         self.logger.info(f"Set global parameters for session {session_id}")
 
-        return SetGlobalParametersOutput(
+        return SetGlobalParametersOutput.model_construct(
             session_id=session_id,
             message="Global parameters set successfully",
         )
@@ -326,8 +332,9 @@ class SessionManager:
 
         # Create fragment instance
         fragment_instance_guid = str(uuid.uuid4())
-        fragment_instance = FragmentInstance(
-            fragment_id=fragment_id,
+        # Parameters were validated against the fragment schema above
+        fragment_instance = FragmentInstance.model_construct(
+            fragment_id=sys.intern(fragment_id),
             parameters=parameters,
             fragment_instance_guid=fragment_instance_guid,
             created_at=datetime.utcnow().isoformat(),
@@ -347,7 +354,7 @@ class SessionManager:
             f"to session {session_id} at position {insert_index}"
         )
 
-        return AddFragmentOutput(
+        return AddFragmentOutput.model_construct(
             session_id=session_id,
             fragment_instance_guid=fragment_instance_guid,
             fragment_id=fragment_id,
@@ -373,32 +380,24 @@ class SessionManager:
             return 0
         elif position == "end":
             return len(session.fragments)
-        elif position.startswith("before:"):
-            guid = position[7:]
-            for idx, frag in enumerate(session.fragments):
-                if frag.fragment_instance_guid == guid:
-                    return idx
-            raise SessionValidationError(
-                code="FRAGMENT_NOT_FOUND",
-                message=f"Fragment instance '{guid}' not found in session",
-                details={"fragment_instance_guid": guid, "position": position},
-            )
-        elif position.startswith("after:"):
-            guid = position[6:]
+
+        # 'before:<guid>' / 'after:<guid>' - split once, then a single scan
+        relation, sep, guid = position.partition(":")
+        if sep and relation in _RELATIVE_POSITION_OFFSETS:
             for idx, frag in enumerate(session.fragments):
                 if frag.fragment_instance_guid == guid:
-                    return idx + 1
+                    return idx + _RELATIVE_POSITION_OFFSETS[relation]
             raise SessionValidationError(
                 code="FRAGMENT_NOT_FOUND",
                 message=f"Fragment instance '{guid}' not found in session",
                 details={"fragment_instance_guid": guid, "position": position},
             )
-        else:
-            raise SessionValidationError(
-                code="INVALID_POSITION",
-                message=f"Invalid position '{position}'. Expected 'start', 'end', 'before:<guid>', or 'after:<guid>'",
-                details={"position": position},
-            )
+
+        raise SessionValidationError(
+            code="INVALID_POSITION",
+            message=f"Invalid position '{position}'. Expected 'start', 'end', 'before:<guid>', or 'after:<guid>'",
+            details={"position": position},
+        )
 
     async def remove_fragment(
         self, session_id: str, fragment_instance_guid: str
@@ -445,7 +444,7 @@ class SessionManager:
             f"Removed fragment instance {fragment_instance_guid} from session {session_id}"
         )
 
-        return RemoveFragmentOutput(
+        return RemoveFragmentOutput.model_construct(
             session_id=session_id,
             fragment_instance_guid=fragment_instance_guid,
             message="Fragment removed successfully",
@@ -468,25 +467,26 @@ class SessionManager:
         if session is None:
             raise SessionNotFoundError(session_id)
 
-        fragment_infos = []
-        for idx, fragment_instance in enumerate(session.fragments):
+        template_id = session.template_id
+        get_fragment_schema = self.template_registry.get_fragment_schema
+
+        def fragment_name(fragment_id: str) -> str:
             # Get fragment name from template
-            fragment_schema = self.template_registry.get_fragment_schema(
-                session.template_id, fragment_instance.fragment_id
-            )
-            fragment_name = fragment_schema.name if fragment_schema else "Unknown"
-
-            fragment_infos.append(
-                SessionFragmentInfo(
-                    fragment_instance_guid=fragment_instance.fragment_instance_guid or "",
-                    fragment_id=fragment_instance.fragment_id,
-                    fragment_name=fragment_name,
-                    position=idx,
-                    parameters=fragment_instance.parameters,
-                )
+            fragment_schema = get_fragment_schema(template_id, fragment_id)
+            return fragment_schema.name if fragment_schema else "Unknown"
+
+        fragment_infos = tuple(
+            SessionFragmentInfo(
+                fragment_instance_guid=fragment_instance.fragment_instance_guid or "",
+                fragment_id=fragment_instance.fragment_id,
+                fragment_name=fragment_name(fragment_instance.fragment_id),
+                position=idx,
+                parameters=fragment_instance.parameters,
             )
+            for idx, fragment_instance in enumerate(session.fragments)
+        )
 
-        return ListSessionFragmentsOutput(
+        return ListSessionFragmentsOutput.model_construct(
             session_id=session_id,
             fragment_count=len(fragment_infos),
             fragments=fragment_infos,
@@ -513,7 +513,7 @@ class SessionManager:
 
         self.logger.info(f"Aborted session {session_id}")
 
-        return AbortSessionOutput(
+        return AbortSessionOutput.model_construct(
             session_id=session_id,
             message="Session terminated and all data deleted",
         )
@@ -562,10 +562,10 @@ class SessionManager:
         if session is None:
             raise ValueError(f"Session '{session_id}' not found")
 
-        has_globals = session.global_parameters is not None and len(session.global_parameters) > 0
+        has_globals = bool(session.global_parameters)
         is_ready, _ = await self.validate_session_for_render(session_id)
 
-        return SessionStatusOutput(
+        return SessionStatusOutput.model_construct(
             session_id=session.session_id,
             template_id=session.template_id,
             group=session.group,
@@ -596,9 +596,7 @@ class SessionManager:
         for session_id in session_ids:
             session = await self.get_session(session_id)
             if session:
-                has_globals = (
-                    session.global_parameters is not None and len(session.global_parameters) > 0
-                )
+                has_globals = bool(session.global_parameters)
                 summaries.append(
                     SessionSummary(
                         session_id=session.session_id,
@@ -614,9 +612,9 @@ class SessionManager:
 
         self.logger.info(f"Listed {len(summaries)} active sessions")
 
-        return ListActiveSessionsOutput(
+        return ListActiveSessionsOutput.model_construct(
             session_count=len(summaries),
-            sessions=summaries,
+            sessions=tuple(summaries),
         )
 
     async def validate_parameters(
@@ -679,18 +677,18 @@ class SessionManager:
                             ),
                             expected=param_schema.type if param_schema else "valid parameter value",
                             suggestions=(
-                                [param_schema.example]
+                                [str(param_schema.example)]
                                 if param_schema and param_schema.example
                                 else []
                             ),
                         )
                     )
 
-            return ValidateParametersOutput(
+            return ValidateParametersOutput.model_construct(
                 is_valid=is_valid,
                 parameter_type="global",
                 template_id=template_id,
-                errors=errors,
+                errors=tuple(errors),
                 message=(
                     "Parameters valid" if is_valid else f"Found {len(errors)} validation errors"
                 ),
@@ -727,19 +725,19 @@ class SessionManager:
                             ),
                             expected=param_schema.type if param_schema else "valid parameter value",
                             suggestions=(
-                                [param_schema.example]
+                                [str(param_schema.example)]
                                 if param_schema and param_schema.example
                                 else []
                             ),
                         )
                     )
 
-            return ValidateParametersOutput(
+            return ValidateParametersOutput.model_construct(
                 is_valid=is_valid,
                 parameter_type="fragment",
                 template_id=template_id,
                 fragment_id=fragment_id,
-                errors=errors,
+                errors=tuple(errors),
                 message=(
                     "Parameters valid" if is_valid else f"Found {len(errors)} validation errors"
                 ),
@@ -60,9 +60,8 @@ class SessionStore:
         if not path.exists():
             return None
         try:
-            with path.open("r", encoding="utf-8") as handle:
-                data = json.load(handle)
-            session = DocumentSession(**data)
+            # Parse and validate (including nested fragment instances) in one pass
+            session = DocumentSession.model_validate_json(path.read_bytes())
             if self.logger:
                 self.logger.debug("Session loaded", session_id=session_id, path=str(path))
             return session
@@ -4,15 +4,22 @@ Stores documents as files in a directory with GUID-based filenames.
 Supports group-based segregation for access control.
 """
 
+import os
 import uuid
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterable, Optional, List, Tuple
 from app.storage.base import DocumentStorageBase
 from app.config import get_public_storage_dir
 from app.logger import Logger, session_logger
 
+# Known document formats, in lookup-preference order
+_DOCUMENT_FORMATS = ("png", "jpg", "jpeg", "svg", "pdf", "json")
+
+# Filename suffixes recognised as stored documents
+_VALID_EXTS = frozenset(f".{ext}" for ext in _DOCUMENT_FORMATS)
+
 
 class FileStorage(DocumentStorageBase):
     """File-based document storage using GUID filenames with group-based segregation"""
@@ -74,8 +81,36 @@ class FileStorage(DocumentStorageBase):
             self.logger.error("Failed to save metadata", error=str(e))
             raise RuntimeError(f"Failed to save metadata: {str(e)}")
 
+    def _write_file(self, filepath: Path, data: bytes, durable: bool = False) -> None:
+        """
+        Write bytes to a file, optionally forcing them to stable storage
+
+        Args:
+            filepath: Destination path (created or truncated)
+            data: Raw bytes to write
+            durable: If True, fdatasync the file before returning
+        """
+        if not durable:
+            with open(filepath, "wb") as f:
+                f.write(data)
+            return
+
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+            os.fdatasync(fd)
+        finally:
+            os.close(fd)
+
     def save_document(
-        self, document_data: bytes, format: str = "json", group: Optional[str] = None
+        self,
+        document_data: bytes,
+        format: str = "json",
+        group: Optional[str] = None,
+        durable: bool = False,
     ) -> str:
         """
         Save document data to disk with a unique GUID
@@ -84,6 +119,8 @@ class FileStorage(DocumentStorageBase):
             document_data: Raw document bytes
             format: Document format (png, jpg, svg, pdf, json, etc.)
             group: Optional group name for access control (defaults to 'public')
+            durable: If True, the file is fdatasync'ed before returning so it survives a crash.
+                Defaults to False, leaving durability to kernel writeback.
 
         Returns:
             GUID string (identifier without extension)
@@ -106,11 +143,11 @@ class FileStorage(DocumentStorageBase):
             format=format,
             size=len(document_data),
             group=group,
+            durable=durable,
         )
 
         try:
-            with open(filepath, "wb") as f:
-                f.write(document_data)
+            self._write_file(filepath, document_data, durable=durable)
 
             # Store metadata with timestamp
             self.metadata[guid] = {
@@ -127,6 +164,76 @@ class FileStorage(DocumentStorageBase):
             self.logger.error("Failed to save document file", guid=guid, error=str(e))
             raise RuntimeError(f"Failed to save document: {str(e)}")
 
+    def save_documents(
+        self,
+        items: Iterable[Tuple[bytes, str]],
+        group: Optional[str] = None,
+        durable: bool = False,
+    ) -> List[str]:
+        """
+        Save several documents, writing metadata once for the whole batch
+
+        All files are written first; when durable is True they are then synced
+        together, so the batch pays for one round of syncs rather than one per
+        write interleaved with metadata updates.
+
+        Args:
+            items: Iterable of (document_data, format) pairs
+            group: Optional group name for access control (defaults to 'public')
+            durable: If True, sync all written files before metadata is saved
+
+        Returns:
+            List of GUID strings, in the same order as items
+
+        Raises:
+            RuntimeError: If any save fails
+        """
+        if group is None:
+            group = self.DEFAULT_GROUP
+
+        written: List[Tuple[str, Path, str, int]] = []
+        # Every path opened for writing, including one whose write failed
+        created: List[Path] = []
+        try:
+            for document_data, format in items:
+                guid = str(uuid.uuid4())
+                fmt = format.lower()
+                filepath = self.storage_dir / f"{guid}.{fmt}"
+                created.append(filepath)
+                self._write_file(filepath, document_data)
+                written.append((guid, filepath, fmt, len(document_data)))
+
+            if durable:
+                for _, filepath, _, _ in written:
+                    fd = os.open(filepath, os.O_RDONLY)
+                    try:
+                        os.fdatasync(fd)
+                    finally:
+                        os.close(fd)
+
+            created_at = datetime.utcnow().isoformat()
+            for guid, _, fmt, size in written:
+                self.metadata[guid] = {
+                    "format": fmt,
+                    "group": group,
+                    "size": size,
+                    "created_at": created_at,
+                }
+            self._save_metadata()
+
+            self.logger.info(
+                "Documents saved to file", count=len(written), group=group, durable=durable
+            )
+            return [guid for guid, _, _, _ in written]
+        except Exception as e:
+            self.logger.error("Failed to save document batch", count=len(written), error=str(e))
+            # Leave nothing behind: no orphaned files, no in-memory metadata for them
+            for guid, _, _, _ in written:
+                self.metadata.pop(guid, None)
+            for filepath in created:
+                filepath.unlink(missing_ok=True)
+            raise RuntimeError(f"Failed to save documents: {str(e)}")
+
     def get_document(self, identifier: str, group: Optional[str] = None) -> Optional[bytes]:
         """
         Retrieve document data by GUID
@@ -162,7 +269,7 @@ class FileStorage(DocumentStorageBase):
         self.logger.debug("Retrieving document from file", guid=identifier, group=group)
 
         # Try common formats (prefer metadata format if available)
-        formats = ["png", "jpg", "jpeg", "svg", "pdf", "json"]
+        formats = list(_DOCUMENT_FORMATS)
         if identifier in self.metadata:
             stored_format = self.metadata[identifier].get("format")
             if stored_format and stored_format in formats:
@@ -222,7 +329,7 @@ class FileStorage(DocumentStorageBase):
                 return False
 
         deleted = False
-        for ext in ["png", "jpg", "jpeg", "svg", "pdf", "json"]:
+        for ext in _DOCUMENT_FORMATS:
             filepath = self.storage_dir / f"{identifier}.{ext}"
             if filepath.exists():
                 try:
@@ -258,14 +365,7 @@ class FileStorage(DocumentStorageBase):
 
             # Search in storage directory and subdirectories
             for filepath in self.storage_dir.rglob("*"):
-                if filepath.is_file() and filepath.suffix in [
-                    ".png",
-                    ".jpg",
-                    ".jpeg",
-                    ".svg",
-                    ".pdf",
-                    ".json",
-                ]:
+                if filepath.suffix in _VALID_EXTS and filepath.is_file():
                     # Skip metadata.json
                     if filepath.name == "metadata.json":
                         continue
@@ -313,7 +413,7 @@ class FileStorage(DocumentStorageBase):
                 return False
 
         # Check for any matching file with common extensions in storage dir
-        for ext in ["png", "jpg", "jpeg", "svg", "pdf", "json"]:
+        for ext in _DOCUMENT_FORMATS:
             filepath = self.storage_dir / f"{identifier}.{ext}"
             if filepath.exists():
                 return True
@@ -406,7 +506,7 @@ class FileStorage(DocumentStorageBase):
 
                 # Check if file exists
                 file_exists = False
-                for ext in ["png", "jpg", "jpeg", "svg", "pdf", "json"]:
+                for ext in _DOCUMENT_FORMATS:
                     if (self.storage_dir / f"{guid}.{ext}").exists():
                         file_exists = True
                         break
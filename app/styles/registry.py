@@ -3,7 +3,7 @@
 import yaml
 from typing import Dict, List, Optional
 
-from app.registries.base import BaseRegistry
+from app.registries.base import BaseRegistry, SafeYamlLoader
 from app.styles.style_metadata import StyleMetadata
 from app.styles.style_list_item import StyleListItem
 from app.logger import Logger
@@ -32,6 +32,9 @@ class StyleRegistry(BaseRegistry):
         self._styles: Dict[str, StyleMetadata] = {}
         self._css_content: Dict[str, str] = {}
         self._default_style_id: Optional[str] = None
+        # Listing caches, rebuilt whenever styles are (re)loaded
+        self._list_cache: List[StyleListItem] = []
+        self._by_group_cache: Dict[str, List[StyleListItem]] = {}
         super().__init__(styles_dir, logger, group, groups)
 
     def _get_registry_type(self) -> str:
@@ -42,6 +45,23 @@ class StyleRegistry(BaseRegistry):
         """Load all styles from all configured groups."""
         for group in self.groups:
             self._load_group_items(group)
+        self._build_list_cache()
+
+    def _build_list_cache(self) -> None:
+        """Precompute style list items; the registry is immutable after load."""
+        # Metadata was validated on load, so skip re-validation
+        self._list_cache = [
+            StyleListItem.model_construct(
+                style_id=metadata.style_id,
+                name=metadata.name,
+                description=metadata.description,
+                group=metadata.group,
+            )
+            for metadata in self._styles.values()
+        ]
+        self._by_group_cache = {group: [] for group in self.groups}
+        for item in self._list_cache:
+            self._by_group_cache.setdefault(item.group, []).append(item)
 
     def _load_group_items(self, group: str) -> None:
         """Load styles from a specific group directory."""
@@ -66,7 +86,7 @@ class StyleRegistry(BaseRegistry):
             try:
                 # Load metadata
                 with open(metadata_file, "r") as f:
-                    metadata_data = yaml.safe_load(f)
+                    metadata_data = yaml.load(f, Loader=SafeYamlLoader)
 
                 style_metadata = StyleMetadata(**metadata_data)
                 style_id = style_metadata.style_id
@@ -109,44 +129,16 @@ class StyleRegistry(BaseRegistry):
             group: Filter by specific group (None = all loaded groups)
         """
         if group:
-            if group not in self.groups:
+            if group not in self._groups_set:
                 return []
             # Filter by group
-            items = [
-                StyleListItem(
-                    style_id=metadata.style_id,
-                    name=metadata.name,
-                    description=metadata.description,
-                    group=metadata.group,
-                )
-                for metadata in self._styles.values()
-                if metadata.group == group
-            ]
-        else:
-            # All loaded groups
-            items = [
-                StyleListItem(
-                    style_id=metadata.style_id,
-                    name=metadata.name,
-                    description=metadata.description,
-                    group=metadata.group,
-                )
-                for metadata in self._styles.values()
-            ]
-        return items
+            return list(self._by_group_cache.get(group, []))
+        # All loaded groups
+        return list(self._list_cache)
 
     def get_items_by_group(self) -> Dict[str, List[StyleListItem]]:
         """Get all styles organized by group."""
-        result = {group: [] for group in self.groups}
-        for metadata in self._styles.values():
-            item = StyleListItem(
-                style_id=metadata.style_id,
-                name=metadata.name,
-                description=metadata.description,
-                group=metadata.group,
-            )
-            result[metadata.group].append(item)
-        return result
+        return {group: list(items) for group, items in self._by_group_cache.items()}
 
     def get_style_metadata(self, style_id: str) -> Optional[StyleMetadata]:
         """Get metadata for a style."""
@@ -1,11 +1,13 @@
 """Style list item model for style discovery."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class StyleListItem(BaseModel):
     """A summary item for listing available styles."""
 
+    model_config = ConfigDict(frozen=True)
+
     style_id: str
     name: str
     description: str
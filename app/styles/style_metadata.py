@@ -1,11 +1,13 @@
 """Style metadata model loaded from style.yaml."""
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class StyleMetadata(BaseModel):
     """Metadata for a style loaded from style.yaml."""
 
+    model_config = ConfigDict(frozen=True)
+
     style_id: str
     group: str  # NEW: Mandatory group field (must match directory location)
     name: str
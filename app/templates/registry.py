@@ -1,15 +1,17 @@
 """Template registry system for managing document templates."""
-from typing import Dict, List, Optional
+import sys
+from itertools import groupby
+from operator import attrgetter
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 from app.registries.base import BaseRegistry
 from app.validation.document_models import (
     TemplateSchema,
-    TemplateMetadata,
-    ParameterSchema,
     FragmentSchema,
     TemplateListItem,
     TemplateDetailsOutput,
 )
+from app.validation.table_validator import validate_table_data, TableValidationError
 from app.logger import Logger
 from app.exceptions import TemplateNotFoundError, GroupMismatchError
 
@@ -30,6 +32,14 @@ class TemplateRegistry(BaseRegistry):
             groups: Multiple groups to load (e.g., ["public", "research"])
         """
         self._templates: Dict[str, TemplateSchema] = {}
+        # Listing caches, rebuilt whenever templates are (re)loaded
+        self._list_cache: List[TemplateListItem] = []
+        self._by_group_cache: Dict[str, List[TemplateListItem]] = {}
+        # (template_id, fragment_id) -> fragment schema for O(1) lookups
+        self._fragment_index: Dict[Tuple[str, str], FragmentSchema] = {}
+        # Precomputed (required params, expected names) used by parameter validation
+        self._global_param_index: Dict[str, Tuple[Tuple, FrozenSet[str]]] = {}
+        self._fragment_param_index: Dict[Tuple[str, str], Tuple[Tuple, FrozenSet[str]]] = {}
         super().__init__(templates_dir, logger, group, groups)
 
     def _get_registry_type(self) -> str:
@@ -40,16 +50,63 @@ class TemplateRegistry(BaseRegistry):
         """Load all templates from all configured groups."""
         for group in self.groups:
             self._load_group_items(group)
+        self._build_list_cache()
+        self._build_fragment_index()
+        self._build_parameter_indexes()
+
+    def _build_fragment_index(self) -> None:
+        """Index every template fragment by (template_id, fragment_id)."""
+        self._fragment_index = {}
+        for template_id, schema in self._templates.items():
+            for fragment in schema.fragments:
+                # Keep the first declaration, matching the former linear scan
+                self._fragment_index.setdefault((template_id, fragment.fragment_id), fragment)
+
+    def _build_list_cache(self) -> None:
+        """Precompute template list items; the registry is immutable after load."""
+        # Metadata was validated when the schema was built, so skip re-validation
+        self._list_cache = [
+            TemplateListItem.model_construct(
+                template_id=metadata.template_id,
+                name=metadata.name,
+                description=metadata.description,
+                group=metadata.group,
+            )
+            for metadata in map(attrgetter("metadata"), self._templates.values())
+        ]
+        # Sort (stable, so load order is kept within a group) then group, so
+        # each group's list is built in one go rather than appended per item
+        get_group = attrgetter("group")
+        grouped = {
+            group: list(items)
+            for group, items in groupby(sorted(self._list_cache, key=get_group), key=get_group)
+        }
+        # Keep configured group order and include groups with no templates
+        self._by_group_cache = {group: grouped.pop(group, []) for group in self.groups}
+        self._by_group_cache.update(grouped)
+
+    def _build_parameter_indexes(self) -> None:
+        """Precompute parameter validation lookups for globals and every fragment."""
+        self._global_param_index = {
+            template_id: self._build_parameter_index(schema.global_parameters)
+            for template_id, schema in self._templates.items()
+        }
+        self._fragment_param_index = {
+            key: self._build_parameter_index(fragment.parameters)
+            for key, fragment in self._fragment_index.items()
+        }
 
     def _load_group_items(self, group: str) -> None:
         """Load templates from a specific group directory."""
+        group = sys.intern(group)
         group_dir = self.registry_dir / group
         
         if not group_dir.exists():
             self.logger.warning(f"Group directory not found: {group_dir}")
             return
         
-        # Load each template directory in the group
+        # Collect each template directory in the group
+        schema_files = []
         for template_dir in group_dir.iterdir():
             if not template_dir.is_dir():
                 continue
@@ -60,9 +117,14 @@ class TemplateRegistry(BaseRegistry):
                     f"Skipping {template_dir.name}: no template.yaml found"
                 )
                 continue
+            schema_files.append(schema_file)
 
+        # Read and parse concurrently; build and register on this thread so
+        # self._templates is only ever touched by one thread
+        parsed = self._load_yaml_files(schema_files)
+        for schema_file, schema_data in zip(schema_files, parsed):
+            template_dir = schema_file.parent
             try:
-                schema_data = self._load_yaml_file(schema_file)
                 if not schema_data:
                     continue
 
@@ -79,6 +141,15 @@ class TemplateRegistry(BaseRegistry):
                     file_path=str(schema_file)
                 )
 
+                # Intern identifiers: they key every registry lookup and are
+                # shared by the cached list items and fragment index
+                metadata = template_schema.metadata
+                metadata.template_id = template_id = sys.intern(template_id)
+                metadata.group = group
+                for fragment in template_schema.fragments:
+                    fragment.fragment_id = sys.intern(fragment.fragment_id)
+                    fragment.group = group
+
                 self._templates[template_id] = template_schema
                 self.logger.info(
                     f"Loaded template: {template_id} from group '{group}' ({template_schema.metadata.name})"
@@ -93,32 +164,23 @@ class TemplateRegistry(BaseRegistry):
 
     def _build_template_schema(self, data: dict) -> TemplateSchema:
         """Build a TemplateSchema from loaded YAML data."""
-        # Build metadata
-        metadata_data = data.get("metadata", {})
-        metadata = TemplateMetadata(**metadata_data)
-        
-        # Build global parameters
-        global_params = []
-        for param_data in data.get("global_parameters", []):
-            global_params.append(ParameterSchema(**param_data))
-        
-        # Build fragments - these are references within the template
-        # They don't have a separate group; they inherit the template's group
-        fragments = []
-        for frag_data in data.get("fragments", []):
-            params = []
-            for param_data in frag_data.get("parameters", []):
-                params.append(ParameterSchema(**param_data))
-            frag_data_copy = frag_data.copy()
-            frag_data_copy["parameters"] = params
-            # Add group from template metadata (embedded fragments inherit template group)
-            frag_data_copy["group"] = metadata.group
-            fragments.append(FragmentSchema(**frag_data_copy))
-        
-        return TemplateSchema(
-            metadata=metadata,
-            global_parameters=global_params,
-            fragments=fragments
+        metadata_data = data.get("metadata") or {}
+
+        # Fragments are references within the template. They don't have a
+        # separate group; they inherit the template's group. The YAML data is
+        # freshly loaded and owned here, so tag it in place rather than copying.
+        fragments = data.get("fragments", [])
+        for frag_data in fragments:
+            frag_data["group"] = metadata_data.get("group")
+
+        # Metadata, global parameters and fragments (with their nested
+        # parameters) are validated and built in a single model_validate call
+        return TemplateSchema.model_validate(
+            {
+                "metadata": metadata_data,
+                "global_parameters": data.get("global_parameters", []),
+                "fragments": fragments,
+            }
         )
 
     def list_templates(self, group: Optional[str] = None) -> List[TemplateListItem]:
@@ -129,44 +191,16 @@ class TemplateRegistry(BaseRegistry):
             group: Filter by specific group (None = all loaded groups)
         """
         if group:
-            if group not in self.groups:
+            if group not in self._groups_set:
                 return []
             # Filter by group
-            items = [
-                TemplateListItem(
-                    template_id=schema.metadata.template_id,
-                    name=schema.metadata.name,
-                    description=schema.metadata.description,
-                    group=schema.metadata.group,
-                )
-                for schema in self._templates.values()
-                if schema.metadata.group == group
-            ]
-        else:
-            # All loaded groups
-            items = [
-                TemplateListItem(
-                    template_id=schema.metadata.template_id,
-                    name=schema.metadata.name,
-                    description=schema.metadata.description,
-                    group=schema.metadata.group,
-                )
-                for schema in self._templates.values()
-            ]
-        return items
+            return list(self._by_group_cache.get(group, []))
+        # All loaded groups
+        return list(self._list_cache)
 
     def get_items_by_group(self) -> Dict[str, List[TemplateListItem]]:
         """Get all templates organized by group."""
-        result = {group: [] for group in self.groups}
-        for schema in self._templates.values():
-            item = TemplateListItem(
-                template_id=schema.metadata.template_id,
-                name=schema.metadata.name,
-                description=schema.metadata.description,
-                group=schema.metadata.group,
-            )
-            result[schema.metadata.group].append(item)
-        return result
+        return {group: list(items) for group, items in self._by_group_cache.items()}
 
     def get_template_schema(self, template_id: str) -> Optional[TemplateSchema]:
         """Get the full schema for a template."""
@@ -178,27 +212,20 @@ class TemplateRegistry(BaseRegistry):
         if not schema:
             return None
 
-        return TemplateDetailsOutput(
+        # Built from already-validated schema state, so skip re-validation
+        return TemplateDetailsOutput.model_construct(
             template_id=schema.metadata.template_id,
             name=schema.metadata.name,
             description=schema.metadata.description,
             group=schema.metadata.group,
-            global_parameters=schema.global_parameters,
+            global_parameters=tuple(schema.global_parameters),
         )
 
     def get_fragment_schema(
         self, template_id: str, fragment_id: str
     ) -> Optional[FragmentSchema]:
         """Get the schema for a specific fragment within a template."""
-        schema = self._templates.get(template_id)
-        if not schema:
-            return None
-
-        for fragment in schema.fragments:
-            if fragment.fragment_id == fragment_id:
-                return fragment
-
-        return None
+        return self._fragment_index.get((template_id, fragment_id))
 
     def template_exists(self, template_id: str) -> bool:
         """Check if a template exists."""
@@ -243,7 +270,8 @@ class TemplateRegistry(BaseRegistry):
         return self._validate_parameters_against_schema(
             parameters=parameters,
             parameter_schemas=schema.global_parameters,
-            context=f"template '{template_id}'"
+            context=f"template '{template_id}'",
+            parameter_index=self._global_param_index.get(template_id),
         )
 
     def validate_fragment_parameters(
@@ -265,12 +293,12 @@ class TemplateRegistry(BaseRegistry):
         is_valid, errors = self._validate_parameters_against_schema(
             parameters=parameters,
             parameter_schemas=fragment_schema.parameters,
-            context=f"fragment '{fragment_id}' in template '{template_id}'"
+            context=f"fragment '{fragment_id}' in template '{template_id}'",
+            parameter_index=self._fragment_param_index.get((template_id, fragment_id)),
         )
 
         # Fragment-specific validation
         if fragment_id == "table":
-            from app.validation.table_validator import validate_table_data, TableValidationError
             try:
                 validate_table_data(parameters)
             except TableValidationError as e:
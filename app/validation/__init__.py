@@ -5,14 +5,36 @@ Real validation happens via:
 - Pydantic models (automatic validation)
 - SessionManager.validate_parameters() (template/fragment parameter validation)
 - Schema validation in template/fragment registries
+
+Exports are resolved lazily (PEP 562) so importing a submodule such as
+app.validation.color_validator does not pull in the styles package.
 """
 
-from app.validation.error import ValidationError
-from app.styles.style_metadata import StyleMetadata
-from app.styles.style_list_item import StyleListItem
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.validation.error import ValidationError
+    from app.styles.style_metadata import StyleMetadata
+    from app.styles.style_list_item import StyleListItem
+
+_LAZY_EXPORTS = {
+    "ValidationError": "app.validation.error",
+    "StyleMetadata": "app.styles.style_metadata",
+    "StyleListItem": "app.styles.style_list_item",
+}
 
 __all__ = [
     "ValidationError",
     "StyleMetadata",
     "StyleListItem",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_path), name)
+    globals()[name] = value
+    return value
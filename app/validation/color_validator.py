@@ -3,7 +3,6 @@
 Validates theme color names and custom hex colors.
 """
 
-import re
 from typing import Optional, Dict, Any
 
 from app.exceptions import ValidationError
@@ -38,6 +37,17 @@ THEME_COLORS = {
     "muted",
 }
 
+# Precomputed CSS value for each theme color (CSS variable with hex fallback)
+_THEME_CSS = {c: f"var(--gofr-doc-{c}, #{c})" for c in THEME_COLORS}
+
+# Characters allowed after the '#' in a hex color (#RGB or #RRGGBB)
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+def _is_hex_color(color: str) -> bool:
+    """Check a stripped string is #RGB or #RRGGBB without the regex engine."""
+    return len(color) in (4, 7) and color[0] == "#" and all(ch in _HEX_DIGITS for ch in color[1:])
+
 
 def validate_color(color: Optional[str]) -> bool:
     """Validate a color value.
@@ -59,8 +69,7 @@ def validate_color(color: Optional[str]) -> bool:
 
     # Check if it's a valid hex color (#RRGGBB or #RGB)
     if color.startswith("#"):
-        hex_pattern = r"^#([0-9a-f]{3}|[0-9a-f]{6})$"
-        return bool(re.match(hex_pattern, color, re.IGNORECASE))
+        return _is_hex_color(color)
 
     return False
 
@@ -92,17 +101,14 @@ def validate_hex_color(color: str) -> bool:
     if not color:
         return False
 
-    color = color.strip()
-    if not color.startswith("#"):
-        return False
-
-    hex_pattern = r"^#([0-9a-f]{3}|[0-9a-f]{6})$"
-    return bool(re.match(hex_pattern, color, re.IGNORECASE))
+    return _is_hex_color(color.strip())
 
 
 def get_css_color(color: str) -> str:
     """Convert color to CSS value.
 
+    Validation and conversion happen in a single pass over the input.
+
     Args:
         color: Theme color name or hex color
 
@@ -112,17 +118,18 @@ def get_css_color(color: str) -> str:
     Raises:
         ColorValidationError: If color is invalid
     """
-    if not validate_color(color):
-        raise ColorValidationError(f"Invalid color: {color}")
+    if not color or not color.strip():
+        raise ColorValidationError(f"Invalid color format: {color}")
 
-    color_lower = color.strip().lower()
+    stripped = color.strip()
 
-    # Theme color - return CSS variable
-    if color_lower in THEME_COLORS:
-        return f"var(--gofr-doc-{color_lower}, #{color_lower})"
+    # Theme color - return precomputed CSS variable
+    theme_css = _THEME_CSS.get(stripped.lower())
+    if theme_css is not None:
+        return theme_css
 
     # Hex color - return as-is
-    if color.startswith("#"):
-        return color
+    if _is_hex_color(stripped):
+        return stripped
 
-    raise ColorValidationError(f"Invalid color format: {color}")
+    raise ColorValidationError(f"Invalid color: {color}")
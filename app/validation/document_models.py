@@ -45,6 +45,7 @@ from .models import (
     ListSessionFragmentsOutput,
     ListTemplateFragmentsInput,
     OutputFormat,
+    parse_output_format,
     ParameterSchema,
     PingOutput,
     RemoveFragmentInput,
@@ -68,6 +69,7 @@ from .models import (
 __all__ = [
     # Common
     "OutputFormat",
+    "parse_output_format",
     "ErrorResponse",
     # Schema models
     "ParameterSchema",
@@ -1,6 +1,6 @@
 """Validation error model for document generation system."""
 
-from typing import Any, List
+from typing import Any, Tuple
 from pydantic import BaseModel, ConfigDict
 
 
@@ -11,9 +11,13 @@ class ValidationError(BaseModel):
     message: str
     received_value: Any = None
     expected: str
-    suggestions: List[str] = []
+    suggestions: Tuple[str, ...] = ()
 
     model_config = ConfigDict(
+        extra="ignore",
+        frozen=True,
+        # Build the core schema on first use rather than at import
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "field": "template_id",
@@ -22,5 +26,5 @@ class ValidationError(BaseModel):
                 "expected": "Valid template identifier",
                 "suggestions": ["Call list_templates to see available templates"],
             }
-        }
+        },
     )
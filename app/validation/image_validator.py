@@ -4,13 +4,86 @@ Validates image URLs at add time (not render time) to provide immediate feedback
 about accessibility, content-type, and size constraints.
 """
 
+import asyncio
+import re
 import httpx
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Set
 from app.logger import Logger
 
+# Content types accepted as images (compared against the lowercased header)
+_ALLOWED_CONTENT_TYPES = frozenset(
+    {
+        "image/png",
+        "image/jpeg",
+        "image/jpg",
+        "image/gif",
+        "image/webp",
+        "image/svg+xml",
+    }
+)
+
+# Stable, prebuilt forms of the allowed types for error responses
+_ALLOWED_CONTENT_TYPES_SORTED = tuple(sorted(_ALLOWED_CONTENT_TYPES))
+_ALLOWED_CONTENT_TYPES_TEXT = ", ".join(_ALLOWED_CONTENT_TYPES_SORTED)
+
+# Single-byte range request used to learn the size when content-length is absent
+_RANGE_PROBE_HEADERS = {"Range": "bytes=0-0"}
+_CONTENT_RANGE_TOTAL = re.compile(r"/(\d+)$")
+
+# Shared HTTP client so repeated validations reuse pooled keep-alive connections.
+# A client is tied to the event loop it was created on, so remember that loop.
+_CLIENT: Optional[httpx.AsyncClient] = None
+_CLIENT_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_CLIENT_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=128)
+# Pending closes of clients replaced after an event loop change (keeps the tasks alive)
+_CLOSING: Set["asyncio.Future[None]"] = set()
+
+
+async def _aclose_stale_client(client: httpx.AsyncClient) -> None:
+    """Close a client whose event loop has gone away."""
+    try:
+        await client.aclose()
+    except RuntimeError:
+        # Connections opened on a closed loop cannot be shut down through it
+        pass
+
+
+def _discard_client(client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Close a client left over from another event loop without blocking."""
+    if loop is not None and loop.is_running():
+        closing = asyncio.wrap_future(asyncio.run_coroutine_threadsafe(client.aclose(), loop))
+    else:
+        closing = asyncio.ensure_future(_aclose_stale_client(client))
+    _CLOSING.add(closing)
+    closing.add_done_callback(_CLOSING.discard)
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it for the running event loop if needed."""
+    global _CLIENT, _CLIENT_LOOP
 
-@dataclass
+    loop = asyncio.get_running_loop()
+    if _CLIENT is None or _CLIENT.is_closed or _CLIENT_LOOP is not loop:
+        if _CLIENT is not None and not _CLIENT.is_closed:
+            _discard_client(_CLIENT, _CLIENT_LOOP)
+        # No await between check and assignment, so no lock is needed
+        _CLIENT = httpx.AsyncClient(limits=_CLIENT_LIMITS)
+        _CLIENT_LOOP = loop
+    return _CLIENT
+
+
+async def close_image_client() -> None:
+    """Close the shared image validation client (call on server shutdown)."""
+    global _CLIENT, _CLIENT_LOOP
+
+    client, _CLIENT, _CLIENT_LOOP = _CLIENT, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+@dataclass(frozen=True, slots=True)
 class ImageValidationResult:
     """Result of image URL validation."""
 
@@ -20,20 +93,41 @@ class ImageValidationResult:
     error_message: Optional[str] = None
     content_type: Optional[str] = None
     content_length: Optional[int] = None
-    details: Optional[dict] = None
+    details: Optional[Mapping[str, Any]] = None
+
+
+# Fixed scheme failures; returned via replace() with the caller's URL.
+# MappingProxyType keeps the shared details read-only.
+_ERR_REQUIRES_HTTPS = ImageValidationResult(
+    valid=False,
+    url="",
+    error_code="INVALID_IMAGE_URL",
+    error_message="Image URL must use HTTPS protocol (require_https=true)",
+    details=MappingProxyType(
+        {
+            "reason": "Non-HTTPS URL with require_https=true",
+            "recovery": "Use an HTTPS URL or set require_https=false",
+        }
+    ),
+)
+_ERR_INVALID_SCHEME = ImageValidationResult(
+    valid=False,
+    url="",
+    error_code="INVALID_IMAGE_URL",
+    error_message="Image URL must use HTTP or HTTPS protocol",
+    details=MappingProxyType(
+        {
+            "reason": "Invalid URL scheme",
+            "recovery": "Provide a valid HTTP or HTTPS URL",
+        }
+    ),
+)
 
 
 class ImageURLValidator:
     """Validates image URLs at add time (not render time)."""
 
-    ALLOWED_CONTENT_TYPES = {
-        "image/png",
-        "image/jpeg",
-        "image/jpg",
-        "image/gif",
-        "image/webp",
-        "image/svg+xml",
-    }
+    ALLOWED_CONTENT_TYPES = _ALLOWED_CONTENT_TYPES
 
     DEFAULT_MAX_SIZE_MB = 10
     DEFAULT_TIMEOUT_SECONDS = 10
@@ -45,9 +139,26 @@ class ImageURLValidator:
         logger: Optional[Logger] = None,
     ):
         self.max_size_bytes = max_size_mb * 1024 * 1024
+        # Reported in IMAGE_TOO_LARGE details; computed once rather than per failure
+        self._max_size_mb = self.max_size_bytes / (1024 * 1024)
         self.timeout_seconds = timeout_seconds
         self.logger = logger
 
+    async def _probe_content_length(self, client: httpx.AsyncClient, url: str) -> Optional[int]:
+        """Return the total size from a bytes=0-0 range request, or None if unknown."""
+        try:
+            request = client.build_request(
+                "GET", url, headers=_RANGE_PROBE_HEADERS, timeout=self.timeout_seconds
+            )
+            response = await client.send(request, stream=True, follow_redirects=True)
+            await response.aclose()
+        except httpx.HTTPError:
+            return None
+
+        # e.g. "bytes 0-0/12345"; servers that ignore Range send no content-range
+        match = _CONTENT_RANGE_TOTAL.search(response.headers.get("content-range", ""))
+        return int(match.group(1)) if match else None
+
     async def validate_image_url(
         self, url: str, require_https: bool = True
     ) -> ImageValidationResult:
@@ -60,109 +171,97 @@ class ImageURLValidator:
         Returns:
             ImageValidationResult with validation status and details
         """
-        # 1. Scheme validation
-        if require_https and not url.startswith("https://"):
-            return ImageValidationResult(
-                valid=False,
-                url=url,
-                error_code="INVALID_IMAGE_URL",
-                error_message="Image URL must use HTTPS protocol (require_https=true)",
-                details={
-                    "reason": "Non-HTTPS URL with require_https=true",
-                    "recovery": "Use an HTTPS URL or set require_https=false",
-                },
-            )
+        # 1. Scheme validation (parse the scheme once; https is the common case)
+        scheme = url.split("://", 1)[0].lower() if "://" in url else ""
+        if scheme != "https":
+            if require_https:
+                return replace(_ERR_REQUIRES_HTTPS, url=url)
 
-        if not url.startswith(("http://", "https://")):
-            return ImageValidationResult(
-                valid=False,
-                url=url,
-                error_code="INVALID_IMAGE_URL",
-                error_message="Image URL must use HTTP or HTTPS protocol",
-                details={
-                    "reason": "Invalid URL scheme",
-                    "recovery": "Provide a valid HTTP or HTTPS URL",
-                },
-            )
+            if scheme != "http":
+                return replace(_ERR_INVALID_SCHEME, url=url)
 
         # 2. GET request to validate accessibility and content-type
         # Note: Using GET instead of HEAD because some servers (e.g., proxy endpoints)
         # don't support HEAD and return 405 Method Not Allowed
         try:
-            async with httpx.AsyncClient(timeout=self.timeout_seconds) as client:
-                if self.logger:
-                    self.logger.info("Validating image URL", url=url)
-
-                response = await client.get(url, follow_redirects=True)
-
-                # Check status code
-                if response.status_code != 200:
-                    return ImageValidationResult(
-                        valid=False,
-                        url=url,
-                        error_code="IMAGE_URL_NOT_ACCESSIBLE",
-                        error_message=f"Image URL returned HTTP {response.status_code}",
-                        details={
-                            "status_code": response.status_code,
-                            "reason": f"HTTP {response.status_code}",
-                            "recovery": "Verify the URL is correct and accessible. Test it in a browser.",
-                        },
-                    )
-
-                # 3. Content-Type validation
-                content_type = (
-                    response.headers.get("content-type", "").split(";")[0].strip().lower()
+            client = _get_client()
+            if self.logger:
+                self.logger.info("Validating image URL", url=url)
+
+            # Only the status and headers are needed, so close without reading the body
+            request = client.build_request("GET", url, timeout=self.timeout_seconds)
+            response = await client.send(request, stream=True, follow_redirects=True)
+            await response.aclose()
+
+            # Check status code
+            if response.status_code != 200:
+                return ImageValidationResult(
+                    valid=False,
+                    url=url,
+                    error_code="IMAGE_URL_NOT_ACCESSIBLE",
+                    error_message=f"Image URL returned HTTP {response.status_code}",
+                    details={
+                        "status_code": response.status_code,
+                        "reason": f"HTTP {response.status_code}",
+                        "recovery": "Verify the URL is correct and accessible. Test it in a browser.",
+                    },
+                )
+
+            # 3. Content-Type validation
+            content_type = response.headers.get("content-type", "").split(";")[0].strip().lower()
+            if content_type not in _ALLOWED_CONTENT_TYPES:
+                return ImageValidationResult(
+                    valid=False,
+                    url=url,
+                    error_code="INVALID_IMAGE_CONTENT_TYPE",
+                    error_message="URL does not return a valid image content-type",
+                    content_type=content_type,
+                    details={
+                        "content_type": content_type,
+                        "allowed_types": list(_ALLOWED_CONTENT_TYPES_SORTED),
+                        "recovery": f"Ensure the URL points to an image file. Allowed types: {_ALLOWED_CONTENT_TYPES_TEXT}",
+                    },
                 )
-                if content_type not in self.ALLOWED_CONTENT_TYPES:
-                    return ImageValidationResult(
-                        valid=False,
-                        url=url,
-                        error_code="INVALID_IMAGE_CONTENT_TYPE",
-                        error_message="URL does not return a valid image content-type",
-                        content_type=content_type,
-                        details={
-                            "content_type": content_type,
-                            "allowed_types": list(self.ALLOWED_CONTENT_TYPES),
-                            "recovery": f"Ensure the URL points to an image file. Allowed types: {', '.join(self.ALLOWED_CONTENT_TYPES)}",
-                        },
-                    )
-
-                # 4. Size check
-                content_length = response.headers.get("content-length")
-                if content_length:
-                    content_length = int(content_length)
-                    if content_length > self.max_size_bytes:
-                        return ImageValidationResult(
-                            valid=False,
-                            url=url,
-                            error_code="IMAGE_TOO_LARGE",
-                            error_message="Image size exceeds maximum allowed size",
-                            content_type=content_type,
-                            content_length=content_length,
-                            details={
-                                "content_length": content_length,
-                                "max_size_bytes": self.max_size_bytes,
-                                "max_size_mb": self.max_size_bytes / (1024 * 1024),
-                                "recovery": "Use a smaller image or compress the image before uploading",
-                            },
-                        )
-
-                # Success
-                if self.logger:
-                    self.logger.info(
-                        "Image URL validated successfully",
-                        url=url,
-                        content_type=content_type,
-                        content_length=content_length,
-                    )
 
+            # 4. Size check
+            content_length = response.headers.get("content-length")
+            if content_length:
+                content_length = int(content_length)
+            else:
+                # Chunked responses carry no length; ask for the total via a range probe
+                content_length = await self._probe_content_length(client, url)
+            if content_length is not None and content_length > self.max_size_bytes:
                 return ImageValidationResult(
-                    valid=True,
+                    valid=False,
+                    url=url,
+                    error_code="IMAGE_TOO_LARGE",
+                    error_message="Image size exceeds maximum allowed size",
+                    content_type=content_type,
+                    content_length=content_length,
+                    details={
+                        "content_length": content_length,
+                        "max_size_bytes": self.max_size_bytes,
+                        "max_size_mb": self._max_size_mb,
+                        "recovery": "Use a smaller image or compress the image before uploading",
+                    },
+                )
+
+            # Success
+            if self.logger:
+                self.logger.info(
+                    "Image URL validated successfully",
                     url=url,
                     content_type=content_type,
                     content_length=content_length,
                 )
 
+            return ImageValidationResult(
+                valid=True,
+                url=url,
+                content_type=content_type,
+                content_length=content_length,
+            )
+
         except httpx.TimeoutException:
             return ImageValidationResult(
                 valid=False,
@@ -11,7 +11,9 @@ organized by logical grouping:
 All models are re-exported here for backward compatibility.
 """
 
-from .common import ErrorResponse, OutputFormat
+from app.styles.style_list_item import StyleListItem
+
+from .common import ErrorResponse, OutputFormat, parse_output_format
 from .inputs import (
     AbortDocumentSessionInput,
     AddFragmentInput,
@@ -46,7 +48,6 @@ from .outputs import (
     SessionStatusOutput,
     SessionSummary,
     SetGlobalParametersOutput,
-    StyleListItem,
     TemplateDetailsOutput,
     TemplateListItem,
     ValidateParametersOutput,
@@ -64,6 +65,7 @@ from .session import DocumentSession, FragmentInstance
 __all__ = [
     # Common
     "OutputFormat",
+    "parse_output_format",
     "ErrorResponse",
     # Schema models
     "ParameterSchema",
@@ -15,6 +15,27 @@ class OutputFormat(str, Enum):
     MD = "markdown"  # Alias
 
 
+# Accepted format strings -> member; a plain dict hit instead of Enum.__call__
+_FORMAT_LOOKUP = {
+    "html": OutputFormat.HTML,
+    "pdf": OutputFormat.PDF,
+    "markdown": OutputFormat.MARKDOWN,
+    "md": OutputFormat.MARKDOWN,
+}
+
+
+def parse_output_format(value: str) -> OutputFormat:
+    """Convert a format string to OutputFormat, accepting 'md' for markdown.
+
+    Raises:
+        ValueError: If the format is not supported (as OutputFormat(value) does)
+    """
+    try:
+        return _FORMAT_LOOKUP[value]
+    except KeyError:
+        raise ValueError(f"{value!r} is not a valid OutputFormat") from None
+
+
 class ErrorResponse(BaseModel):
     """Error response structure."""
 
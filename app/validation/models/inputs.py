@@ -1,11 +1,60 @@
 """Input models for MCP server tools."""
 
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Literal, Optional, Tuple, Type, TypeVar
 
 from pydantic import BaseModel, ConfigDict
 
+_InputT = TypeVar("_InputT", bound="ToolInput")
 
-class GetTemplateDetailsInput(BaseModel):
+
+@lru_cache(maxsize=512)
+def _validate_cached(cls: Type[_InputT], items: FrozenSet[Tuple[str, type, Any]]) -> _InputT:
+    return super(ToolInput, cls).model_validate({key: value for key, _, value in items})
+
+
+class ToolInput(BaseModel):
+    """Base for MCP tool inputs: immutable, and extra fields from MCP are ignored.
+
+    Validators are built on first use, so tools that are never called cost
+    nothing at import time.
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+    @classmethod
+    def model_validate(cls: Type[_InputT], obj: Any, **kwargs: Any) -> _InputT:
+        """Validate tool arguments, reusing the instance for repeated payloads.
+
+        Instances are frozen, so identical argument dicts (e.g. repeated
+        status polls) can share one. Payloads with unhashable values, such
+        as fragment parameters, are validated normally, as are payloads
+        carrying a token so bearer tokens are never held by the cache.
+        """
+        if not kwargs and type(obj) is dict and obj.get("token") is None:
+            # The value type is part of the key so 1, 1.0 and True stay distinct
+            try:
+                items = frozenset((key, type(value), value) for key, value in obj.items())
+            except TypeError:
+                pass
+            else:
+                return _validate_cached(cls, items)
+        return super().model_validate(obj, **kwargs)
+
+
+class AuthenticatedInput(ToolInput):
+    """Base for tool inputs that carry auth context.
+
+    Args:
+        token: Optional JWT bearer token
+        group: Group context (injected from JWT token, defaults to 'public')
+    """
+
+    token: Optional[str] = None
+    group: str = "public"
+
+
+class GetTemplateDetailsInput(AuthenticatedInput):
     """Input for get_template_details.
 
     Args:
@@ -14,14 +63,10 @@ class GetTemplateDetailsInput(BaseModel):
         group: Group context (injected from JWT token, defaults to 'public')
     """
 
-    model_config = ConfigDict(extra="ignore")  # Ignore extra fields from MCP
-
     template_id: str
-    token: Optional[str] = None
-    group: str = "public"
 
 
-class ListTemplateFragmentsInput(BaseModel):
+class ListTemplateFragmentsInput(AuthenticatedInput):
     """Input for list_template_fragments.
 
     Args:
@@ -30,14 +75,10 @@ class ListTemplateFragmentsInput(BaseModel):
         group: Group context (injected from JWT token, defaults to 'public')
     """
 
-    model_config = ConfigDict(extra="ignore")
-
     template_id: str
-    token: Optional[str] = None
-    group: str = "public"
 
 
-class GetFragmentDetailsInput(BaseModel):
+class GetFragmentDetailsInput(AuthenticatedInput):
     """Input for get_fragment_details.
 
     Args:
@@ -47,15 +88,11 @@ class GetFragmentDetailsInput(BaseModel):
         group: Group context (injected from JWT token, defaults to 'public')
     """
 
-    model_config = ConfigDict(extra="ignore")
-
     template_id: str
     fragment_id: str
-    token: Optional[str] = None
-    group: str = "public"
 
 
-class CreateDocumentSessionInput(BaseModel):
+class CreateDocumentSessionInput(AuthenticatedInput):
     """Input for create_document_session.
 
     Args:
@@ -65,15 +102,11 @@ class CreateDocumentSessionInput(BaseModel):
         token: Optional JWT bearer token (required for authentication)
     """
 
-    model_config = ConfigDict(extra="ignore")
-
     template_id: str
     alias: str
-    group: str = "public"
-    token: Optional[str] = None
 
 
-class SetGlobalParametersInput(BaseModel):
+class SetGlobalParametersInput(AuthenticatedInput):
     """Input for set_global_parameters.
 
     Args:
@@ -83,15 +116,11 @@ class SetGlobalParametersInput(BaseModel):
         token: Optional JWT bearer token (required for authentication)
     """
 
-    model_config = ConfigDict(extra="ignore")
-
     session_id: str
-    parameters: dict
-    group: str = "public"
-    token: Optional[str] = None
+    parameters: Dict[str, Any]
 
 
-class AddFragmentInput(BaseModel):
+class AddFragmentInput(AuthenticatedInput):
     """Input for add_fragment.
 
     Args:
@@ -103,17 +132,13 @@ class AddFragmentInput(BaseModel):
         token: Optional JWT bearer token (required for authentication)
     """
 
-    model_config = ConfigDict(extra="ignore")
-
     session_id: str
     fragment_id: str
-    parameters: dict
+    parameters: Dict[str, Any]
     position: Optional[str] = None
-    group: str = "public"
-    token: Optional[str] = None
 
 
-class AddImageFragmentInput(BaseModel):
+class AddImageFragmentInput(AuthenticatedInput):
     """Input for add_image_fragment.
 
     Args:
@@ -130,22 +155,18 @@ class AddImageFragmentInput(BaseModel):
         token: Optional JWT bearer token (required for authentication)
     """
 
-    model_config = ConfigDict(extra="ignore")
-
     session_id: str
     image_url: str
     title: Optional[str] = None
     width: Optional[int] = None
     height: Optional[int] = None
     alt_text: Optional[str] = None
-    alignment: str = "center"
+    alignment: Literal["left", "center", "right"] = "center"
     require_https: bool = True
     position: Optional[str] = None
-    group: str = "public"
-    token: Optional[str] = None
 
 
-class RemoveFragmentInput(BaseModel):
+class RemoveFragmentInput(AuthenticatedInput):
     """Input for remove_fragment.
 
     Args:
@@ -155,15 +176,11 @@ class RemoveFragmentInput(BaseModel):
         token: Optional JWT bearer token (required for authentication)
     """
 
-    model_config = ConfigDict(extra="ignore")
-
     session_id: str
     fragment_instance_guid: str
-    group: str = "public"
-    token: Optional[str] = None
 
 
-class ListSessionFragmentsInput(BaseModel):
+class ListSessionFragmentsInput(AuthenticatedInput):
     """Input for list_session_fragments.
 
     Args:
@@ -172,14 +189,10 @@ class ListSessionFragmentsInput(BaseModel):
         token: Optional JWT bearer token (required for authentication)
     """
 
-    model_config = ConfigDict(extra="ignore")
-
     session_id: str
-    group: str = "public"
-    token: Optional[str] = None
 
 
-class AbortDocumentSessionInput(BaseModel):
+class AbortDocumentSessionInput(AuthenticatedInput):
     """Input for abort_document_session.
 
     Args:
@@ -188,14 +201,10 @@ class AbortDocumentSessionInput(BaseModel):
         token: Optional JWT bearer token (required for authentication)
     """
 
-    model_config = ConfigDict(extra="ignore")
-
     session_id: str
-    group: str = "public"
-    token: Optional[str] = None
 
 
-class GetSessionStatusInput(BaseModel):
+class GetSessionStatusInput(AuthenticatedInput):
     """Input for get_session_status.
 
     Args:
@@ -204,14 +213,10 @@ class GetSessionStatusInput(BaseModel):
         token: Optional JWT bearer token (required for authentication)
     """
 
-    model_config = ConfigDict(extra="ignore")
-
     session_id: str
-    group: str = "public"
-    token: Optional[str] = None
 
 
-class ListActiveSessionsInput(BaseModel):
+class ListActiveSessionsInput(AuthenticatedInput):
     """Input for list_active_sessions.
 
     Args:
@@ -219,13 +224,8 @@ class ListActiveSessionsInput(BaseModel):
         token: Optional JWT bearer token (required for authentication)
     """
 
-    model_config = ConfigDict(extra="ignore")
-
-    group: str = "public"
-    token: Optional[str] = None
-
 
-class ValidateParametersInput(BaseModel):
+class ValidateParametersInput(AuthenticatedInput):
     """Input for validate_parameters.
 
     Args:
@@ -237,33 +237,23 @@ class ValidateParametersInput(BaseModel):
         token: Optional JWT bearer token (required for authentication)
     """
 
-    model_config = ConfigDict(extra="ignore")
-
     template_id: str
-    parameters: dict
-    parameter_type: str = "global"
+    parameters: Dict[str, Any]
+    parameter_type: Literal["global", "fragment"] = "global"
     fragment_id: Optional[str] = None
-    group: str = "public"
-    token: Optional[str] = None
 
 
-class GetDocumentInput(BaseModel):
+class GetDocumentInput(AuthenticatedInput):
     """Input for get_document."""
 
-    model_config = ConfigDict(extra="ignore")
-
     session_id: str
-    format: str
+    format: Literal["html", "pdf", "markdown", "md"]
     style_id: Optional[str] = None
-    group: str = "public"
-    token: Optional[str] = None
     proxy: bool = False
 
 
-class GetProxyDocumentInput(BaseModel):
+class GetProxyDocumentInput(ToolInput):
     """Input for retrieving a proxied document."""
 
-    model_config = ConfigDict(extra="ignore")
-
     proxy_guid: str
     token: Optional[str] = None
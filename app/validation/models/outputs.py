@@ -1,16 +1,20 @@
 """Output models for MCP server tools."""
 
-from typing import Any, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict
+
+from app.validation.error import ValidationError
 
 from .common import OutputFormat
+from .schema import ParameterSchema
 
 
 class PingOutput(BaseModel):
     """Output for ping."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     status: str
     timestamp: str
@@ -20,6 +24,8 @@ class PingOutput(BaseModel):
 class TemplateListItem(BaseModel):
     """Template item for discovery responses."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     template_id: str
     name: str
     description: str
@@ -29,19 +35,19 @@ class TemplateListItem(BaseModel):
 class TemplateDetailsOutput(BaseModel):
     """Template details including parameters."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     template_id: str
     name: str
     description: str
     group: str  # Mandatory - comes from template metadata
-    global_parameters: List[Any] = Field(default_factory=list)  # Can be ParameterSchema or dict
+    global_parameters: Tuple[ParameterSchema, ...] = ()
 
 
 class FragmentListItem(BaseModel):
     """Fragment item in template discovery."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     fragment_id: str
     name: str
@@ -52,29 +58,19 @@ class FragmentListItem(BaseModel):
 class FragmentDetailsOutput(BaseModel):
     """Detailed information about a fragment."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     template_id: str
     fragment_id: str
     name: str
     description: str
-    parameters: List[Any] = Field(default_factory=list)  # Can be ParameterSchema or dict
-
-
-class StyleListItem(BaseModel):
-    """Style item for discovery."""
-
-    model_config = ConfigDict(extra="ignore")
-
-    style_id: str
-    name: str
-    description: str
+    parameters: Tuple[ParameterSchema, ...] = ()
 
 
 class CreateSessionOutput(BaseModel):
     """Output from creating a new document session."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     session_id: str
     alias: str
@@ -85,28 +81,32 @@ class CreateSessionOutput(BaseModel):
 class SetGlobalParametersOutput(BaseModel):
     """Output from setting global parameters."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     session_id: str
     message: str
 
 
-class SessionFragmentInfo(BaseModel):
-    """Information about a fragment instance in a session."""
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SessionFragmentInfo:
+    """Information about a fragment instance in a session.
 
-    model_config = ConfigDict(extra="ignore")
+    A slotted dataclass rather than a model: one is built per fragment from
+    trusted session data, and the containing output model still validates
+    and serialises it.
+    """
 
     fragment_instance_guid: str
     fragment_id: str
     fragment_name: str
     position: int
-    parameters: dict = Field(default_factory=dict)
+    parameters: Dict[str, Any] = field(default_factory=dict)
 
 
 class AddFragmentOutput(BaseModel):
     """Output from adding a fragment to a session."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     session_id: str
     fragment_instance_guid: str
@@ -118,7 +118,7 @@ class AddFragmentOutput(BaseModel):
 class RemoveFragmentOutput(BaseModel):
     """Output from removing a fragment from a session."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     session_id: str
     fragment_instance_guid: str
@@ -128,17 +128,17 @@ class RemoveFragmentOutput(BaseModel):
 class ListSessionFragmentsOutput(BaseModel):
     """Output from listing fragments in a session."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     session_id: str
     fragment_count: int
-    fragments: List[Any] = Field(default_factory=list)
+    fragments: Tuple[SessionFragmentInfo, ...] = ()
 
 
 class AbortSessionOutput(BaseModel):
     """Output from aborting a session."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     session_id: str
     message: str
@@ -151,7 +151,7 @@ class GetDocumentOutput(BaseModel):
     When proxy=false, returns full content for direct use.
     """
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     session_id: str
     format: OutputFormat
@@ -165,7 +165,7 @@ class GetDocumentOutput(BaseModel):
 class GetProxyDocumentOutput(BaseModel):
     """Output from retrieving a proxied document."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     proxy_guid: str
     format: OutputFormat
@@ -177,7 +177,7 @@ class GetProxyDocumentOutput(BaseModel):
 class SessionStatusOutput(BaseModel):
     """Output from get_session_status showing current session state."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     session_id: str
     template_id: str
@@ -190,10 +190,9 @@ class SessionStatusOutput(BaseModel):
     message: str
 
 
-class SessionSummary(BaseModel):
-    """Summary information for a session."""
-
-    model_config = ConfigDict(extra="ignore")
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SessionSummary:
+    """Summary information for a session (a slotted dataclass, like SessionFragmentInfo)."""
 
     session_id: str
     alias: Optional[str] = None  # Friendly name for the session
@@ -208,42 +207,33 @@ class SessionSummary(BaseModel):
 class ListActiveSessionsOutput(BaseModel):
     """Output from list_active_sessions showing all available sessions."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     session_count: int
-    sessions: List[SessionSummary] = Field(default_factory=list)
-
-
-class ValidationErrorDetail(BaseModel):
-    """Detailed validation error with context."""
+    sessions: Tuple[SessionSummary, ...] = ()
 
-    model_config = ConfigDict(extra="ignore")
 
-    parameter: str
-    error: str
-    expected_type: Optional[str] = None
-    received_type: Optional[str] = None
-    allowed_values: Optional[List[Any]] = None
-    example: Optional[Any] = None
+# Parameter validation errors share the single ValidationError model
+ValidationErrorDetail = ValidationError
 
 
 class ValidateParametersOutput(BaseModel):
     """Output from validate_parameters showing validation results."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     is_valid: bool
     parameter_type: str  # 'global' or 'fragment'
     template_id: str
     fragment_id: Optional[str] = None
-    errors: List[ValidationErrorDetail] = Field(default_factory=list)
+    errors: Tuple[ValidationError, ...] = ()
     message: str = ""
 
 
 class HelpOutput(BaseModel):
     """Output from help tool with comprehensive workflow documentation."""
 
-    model_config = ConfigDict(extra="ignore")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     service_name: str
     version: str
@@ -1,8 +1,8 @@
 """Schema models for templates, fragments, and styles loaded from YAML."""
 
-from typing import Any, List, Optional
+from typing import Any, Optional, Tuple
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict
 
 
 class ParameterSchema(BaseModel):
@@ -40,7 +40,7 @@ class FragmentSchema(BaseModel):
     group: str  # NEW: Mandatory group field (must match directory location)
     name: str
     description: str
-    parameters: List[ParameterSchema] = Field(default_factory=list)
+    parameters: Tuple[ParameterSchema, ...] = ()
 
 
 class TemplateSchema(BaseModel):
@@ -49,8 +49,8 @@ class TemplateSchema(BaseModel):
     model_config = ConfigDict(extra="allow")  # Allow extra fields from YAML
 
     metadata: TemplateMetadata
-    global_parameters: List[ParameterSchema] = Field(default_factory=list)
-    fragments: List[FragmentSchema] = Field(default_factory=list)
+    global_parameters: Tuple[ParameterSchema, ...] = ()
+    fragments: Tuple[FragmentSchema, ...] = ()
 
 
 class StyleSchema(BaseModel):
@@ -62,4 +62,4 @@ class StyleSchema(BaseModel):
     group: str  # NEW: Mandatory group field (must match directory location)
     name: str
     description: str
-    parameters: List[ParameterSchema] = Field(default_factory=list)
+    parameters: Tuple[ParameterSchema, ...] = ()
@@ -1,8 +1,9 @@
 """Session models for document generation."""
 
-from typing import List, Optional
+import sys
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class FragmentInstance(BaseModel):
@@ -11,10 +12,16 @@ class FragmentInstance(BaseModel):
     model_config = ConfigDict(extra="ignore")
 
     fragment_id: str
-    parameters: dict = Field(default_factory=dict)
+    parameters: Dict[str, Any] = Field(default_factory=dict)
     fragment_instance_guid: Optional[str] = None
     created_at: Optional[str] = None
 
+    @field_validator("fragment_id")
+    @classmethod
+    def _intern_fragment_id(cls, value: str) -> str:
+        # Share the registry's interned key so fragment schema lookups hit on identity
+        return sys.intern(value)
+
 
 class DocumentSession(BaseModel):
     """Active document session state."""
@@ -27,5 +34,12 @@ class DocumentSession(BaseModel):
     updated_at: str
     group: str  # Mandatory - track group context in session
     alias: Optional[str] = None  # Optional friendly name for session
-    global_parameters: dict = Field(default_factory=dict)
+    global_parameters: Dict[str, Any] = Field(default_factory=dict)
     fragments: List[FragmentInstance] = Field(default_factory=list)
+
+    @field_validator("template_id", "group")
+    @classmethod
+    def _intern_keys(cls, value: str) -> str:
+        # Values decoded from session JSON are fresh strings; intern them so
+        # registry lookups by template id and group compare by identity
+        return sys.intern(value)
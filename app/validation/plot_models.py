@@ -5,12 +5,79 @@ These models are used by handle_call_tool's Pydantic validation error handler
 to provide structured error messages when input validation fails.
 """
 
-from typing import List, Optional
+from typing import Annotated, List, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
+# Data series can hold thousands of points; stop at the first bad value
+# (Field(fail_fast=...) needs pydantic 2.8+)
+FloatSeries = Annotated[List[float], Field(fail_fast=True)]
 
-class RenderGraphInput(BaseModel):
+
+class AuthenticatedPlotInput(BaseModel):
+    """Base for plot tool inputs; carries the auth context every plot tool accepts.
+
+    Args:
+        auth_token: JWT authentication token (primary)
+        token: JWT authentication token (legacy backward compat)
+        group: Group context (injected from JWT)
+
+    Validators are built on first use, as for the document tool inputs.
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+    auth_token: Optional[str] = None
+    token: Optional[str] = None
+    group: str = "public"
+
+
+class PlotParams(AuthenticatedPlotInput):
+    """Render settings and data series shared by render_graph and add_plot_fragment.
+
+    Args:
+        type: Chart type (line, scatter, bar)
+        format: Output format (png, jpg, svg, pdf)
+        theme: Visual theme
+        line_width, marker_size, alpha: Styling
+        xlabel/ylabel: Axis labels
+        label1-label5: Dataset labels (optional)
+        color1-color5, color: Dataset colors (optional)
+        x: X-axis data points (optional, auto-generated indices if omitted)
+        y, y1-y5: Datasets
+    """
+
+    type: str = "line"
+    format: str = "png"
+    theme: str = "light"
+    line_width: float = 2.0
+    marker_size: float = 36.0
+    alpha: float = 1.0
+    xlabel: str = "X-axis"
+    ylabel: str = "Y-axis"
+    label1: Optional[str] = None
+    label2: Optional[str] = None
+    label3: Optional[str] = None
+    label4: Optional[str] = None
+    label5: Optional[str] = None
+    color1: Optional[str] = None
+    color2: Optional[str] = None
+    color3: Optional[str] = None
+    color4: Optional[str] = None
+    color5: Optional[str] = None
+    color: Optional[str] = None
+
+    # Data series after the scalar options
+    x: Optional[FloatSeries] = None
+    y: Optional[FloatSeries] = None
+    y1: Optional[FloatSeries] = None
+    y2: Optional[FloatSeries] = None
+    y3: Optional[FloatSeries] = None
+    y4: Optional[FloatSeries] = None
+    y5: Optional[FloatSeries] = None
+
+
+class RenderGraphInput(PlotParams):
     """Input for render_graph tool.
 
     Args:
@@ -31,51 +98,20 @@ class RenderGraphInput(BaseModel):
         group: Group context (injected from JWT)
     """
 
-    model_config = ConfigDict(extra="ignore")
-
     title: str
-    x: Optional[List[float]] = None
-    y: Optional[List[float]] = None
-    y1: Optional[List[float]] = None
-    y2: Optional[List[float]] = None
-    y3: Optional[List[float]] = None
-    y4: Optional[List[float]] = None
-    y5: Optional[List[float]] = None
-    label1: Optional[str] = None
-    label2: Optional[str] = None
-    label3: Optional[str] = None
-    label4: Optional[str] = None
-    label5: Optional[str] = None
-    color1: Optional[str] = None
-    color2: Optional[str] = None
-    color3: Optional[str] = None
-    color4: Optional[str] = None
-    color5: Optional[str] = None
-    color: Optional[str] = None
-    xlabel: str = "X-axis"
-    ylabel: str = "Y-axis"
-    type: str = "line"
-    format: str = "png"
     proxy: bool = False
     alias: Optional[str] = None
-    line_width: float = 2.0
-    marker_size: float = 36.0
-    alpha: float = 1.0
-    theme: str = "light"
     xmin: Optional[float] = None
     xmax: Optional[float] = None
     ymin: Optional[float] = None
     ymax: Optional[float] = None
-    x_major_ticks: Optional[List[float]] = None
-    y_major_ticks: Optional[List[float]] = None
-    x_minor_ticks: Optional[List[float]] = None
-    y_minor_ticks: Optional[List[float]] = None
-    auth_token: Optional[str] = None
-    token: Optional[str] = None
-    group: str = "public"
+    x_major_ticks: Optional[FloatSeries] = None
+    y_major_ticks: Optional[FloatSeries] = None
+    x_minor_ticks: Optional[FloatSeries] = None
+    y_minor_ticks: Optional[FloatSeries] = None
 
 
-class GetImageInput(BaseModel):
+class GetImageInput(AuthenticatedPlotInput):
     """Input for get_image tool.
 
     Args:
@@ -85,15 +121,10 @@ class GetImageInput(BaseModel):
         group: Group context (injected from JWT)
     """
 
-    model_config = ConfigDict(extra="ignore")
-
     identifier: str
-    auth_token: Optional[str] = None
-    token: Optional[str] = None
-    group: str = "public"
 
 
-class ListImagesInput(BaseModel):
+class ListImagesInput(AuthenticatedPlotInput):
     """Input for list_images tool.
 
     Args:
@@ -102,14 +133,8 @@ class ListImagesInput(BaseModel):
         group: Group context (injected from JWT)
     """
 
-    model_config = ConfigDict(extra="ignore")
-
-    auth_token: Optional[str] = None
-    token: Optional[str] = None
-    group: str = "public"
 
-
-class AddPlotFragmentInput(BaseModel):
+class AddPlotFragmentInput(PlotParams):
     """Input for add_plot_fragment tool.
 
     Supports two paths:
@@ -132,47 +157,15 @@ class AddPlotFragmentInput(BaseModel):
         group: Group context (injected from JWT)
     """
 
-    model_config = ConfigDict(extra="ignore")
-
     session_id: str
     plot_guid: Optional[str] = None
 
     # Inline render params (used when plot_guid is not provided)
     title: Optional[str] = None
-    x: Optional[List[float]] = None
-    y: Optional[List[float]] = None
-    y1: Optional[List[float]] = None
-    y2: Optional[List[float]] = None
-    y3: Optional[List[float]] = None
-    y4: Optional[List[float]] = None
-    y5: Optional[List[float]] = None
-    label1: Optional[str] = None
-    label2: Optional[str] = None
-    label3: Optional[str] = None
-    label4: Optional[str] = None
-    label5: Optional[str] = None
-    color1: Optional[str] = None
-    color2: Optional[str] = None
-    color3: Optional[str] = None
-    color4: Optional[str] = None
-    color5: Optional[str] = None
-    color: Optional[str] = None
-    xlabel: str = "X-axis"
-    ylabel: str = "Y-axis"
-    type: str = "line"
-    format: str = "png"
-    theme: str = "light"
-    line_width: float = 2.0
-    marker_size: float = 36.0
-    alpha: float = 1.0
 
     # Image fragment params
     width: Optional[int] = None
     height: Optional[int] = None
     alt_text: Optional[str] = None
-    alignment: str = "center"
+    alignment: Literal["left", "center", "right"] = "center"
     position: Optional[str] = None
-
-    auth_token: Optional[str] = None
-    token: Optional[str] = None
-    group: str = "public"
@@ -3,7 +3,9 @@
 Validates table structure, parameters, and constraints for the table fragment type.
 """
 
-from typing import Any, Dict, List, Optional
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from pydantic import BaseModel, field_validator, model_validator
 
@@ -11,6 +13,23 @@ from app.exceptions import ValidationError
 from app.formatting.number_formatter import validate_format_spec
 from app.validation.color_validator import validate_color
 
+# Tables reuse a handful of colors and format specs across rows and columns;
+# both checks are pure functions of a string, so memoize them for this module
+_color_ok = lru_cache(maxsize=256)(validate_color)
+_format_spec_ok = lru_cache(maxsize=256)(validate_format_spec)
+
+_WIDTH_KEYWORDS = frozenset({"auto", "full"})
+# Ordered tuples feed error messages; frozensets back the membership checks
+_ALIGNMENTS = ("left", "center", "right")
+_VALID_ALIGNMENTS = frozenset(_ALIGNMENTS)
+_BORDER_STYLES = ("full", "horizontal", "minimal", "none")
+_VALID_BORDER_STYLES = frozenset(_BORDER_STYLES)
+_VALID_ORDERS = frozenset({"asc", "desc"})
+
+# Table width: canonical whole-number percentage from 1 to 100. Other spellings
+# int() accepts (" 50%", "+50%", "050%") fall back to int() parsing
+_PCT_INT_RE = re.compile(r"([1-9][0-9]?|100)%")
+
 
 class TableValidationError(ValidationError):
     """Table validation errors with structured error information."""
@@ -21,6 +40,138 @@ class TableValidationError(ValidationError):
         self.error_code = error_code
 
 
+def _plain_sort_column(spec: Union[str, int]) -> Union[str, int]:
+    return spec
+
+
+def _dict_sort_column(spec: Dict[str, Any]) -> Union[str, int]:
+    if "column" not in spec:
+        raise TableValidationError(
+            "INVALID_SORT",
+            "Sort specification dict must have 'column' key",
+        )
+    col = spec["column"]
+    if not isinstance(col, (str, int)):
+        raise TableValidationError(
+            "INVALID_SORT",
+            f"Sort column must be string or int. Got: {type(col).__name__}",
+        )
+
+    if "order" in spec:
+        order = spec["order"]
+        if not isinstance(order, str) or order not in _VALID_ORDERS:
+            raise TableValidationError(
+                "INVALID_SORT",
+                f"Sort order must be 'asc' or 'desc'. Got: {order}",
+            )
+    return col
+
+
+def _sort_spec_column(spec: Any) -> Union[str, int]:
+    """Return the column a sort spec refers to, checking its structure.
+
+    Fallback for subclasses (bool, OrderedDict, ...) that miss the exact-type
+    lookup in _SORT_SPEC_HANDLERS.
+    """
+    if isinstance(spec, dict):
+        return _dict_sort_column(spec)
+    if isinstance(spec, (str, int)):
+        return spec
+    raise TableValidationError(
+        "INVALID_SORT",
+        f"Sort specification must be string, int, or dict. Got: {type(spec).__name__}",
+    )
+
+
+# Exact-type dispatch for sort specs: one type() and dict lookup per spec
+_SORT_SPEC_HANDLERS: Dict[type, Callable[[Any], Union[str, int]]] = {
+    str: _plain_sort_column,
+    int: _plain_sort_column,
+    dict: _dict_sort_column,
+}
+
+
+def _validate_index_keyed(
+    v: Optional[Dict[Any, Any]],
+    code: str,
+    label: str,
+    check_value: Callable[[int, Any], Any],
+) -> Optional[Dict[int, Any]]:
+    """Validate a row/column index keyed mapping and return it with int keys.
+
+    JSON serialization converts int keys to strings, so string keys are parsed
+    back. check_value(index, value) raises TableValidationError for a bad value.
+    """
+    if v is None:
+        return v
+
+    normalized: Dict[int, Any] = {}
+    for index, value in v.items():
+        if isinstance(index, str):
+            try:
+                index = int(index)
+            except ValueError:
+                pass  # Still a str, so rejected by the check below
+
+        if not isinstance(index, int) or index < 0:
+            raise TableValidationError(
+                code, f"{label} index must be a non-negative integer. Got: {index}"
+            )
+
+        check_value(index, value)
+        normalized[index] = value
+
+    return normalized
+
+
+def _check_format_spec(index: int, format_spec: Any) -> None:
+    if not _format_spec_ok(format_spec):
+        raise TableValidationError(
+            "INVALID_NUMBER_FORMAT",
+            f"Invalid format specification for column {index}: {format_spec}",
+        )
+
+
+def _check_row_color(index: int, color: Any) -> None:
+    if not _color_ok(color):
+        raise TableValidationError(
+            "INVALID_COLOR",
+            f"Invalid color for row {index}. Must be theme color or hex color. Got: {color}",
+        )
+
+
+def _check_column_color(index: int, color: Any) -> None:
+    if not _color_ok(color):
+        raise TableValidationError(
+            "INVALID_COLOR",
+            f"Invalid color for column {index}. Must be theme color or hex color. Got: {color}",
+        )
+
+
+def _parse_column_width(width_str: Any) -> float:
+    """Return the percentage for a column width such as '25%'."""
+    if not isinstance(width_str, str) or not width_str.endswith("%"):
+        raise TableValidationError(
+            "INVALID_COLUMN_WIDTH",
+            f"Column width must be a percentage string (e.g., '25%'). Got: {width_str}",
+        )
+
+    try:
+        percentage = float(width_str[:-1])
+    except ValueError:
+        raise TableValidationError(
+            "INVALID_COLUMN_WIDTH",
+            f"Invalid percentage format: {width_str}",
+        )
+
+    if percentage <= 0 or percentage > 100:
+        raise TableValidationError(
+            "INVALID_COLUMN_WIDTH",
+            f"Column width percentage must be between 0 and 100. Got: {percentage}%",
+        )
+    return percentage
+
+
 class TableData(BaseModel):
     """Table data model with validation."""
 
@@ -61,16 +212,18 @@ class TableData(BaseModel):
         if not self.rows:
             return self
 
-        column_counts = [len(row) for row in self.rows]
-        if len(set(column_counts)) > 1:
-            raise TableValidationError(
-                "INCONSISTENT_COLUMNS",
-                f"All rows must have the same number of columns. Found: {column_counts}",
-            )
+        column_count = len(self.rows[0])
+        for row in self.rows:
+            if len(row) != column_count:
+                column_counts = [len(row) for row in self.rows]
+                raise TableValidationError(
+                    "INCONSISTENT_COLUMNS",
+                    f"All rows must have the same number of columns. Found: {column_counts}",
+                )
+        row_count = len(self.rows)
 
         # Validate column_alignments count matches column count
         if self.column_alignments is not None:
-            column_count = self.get_column_count()
             if len(self.column_alignments) != column_count:
                 raise TableValidationError(
                     "ALIGNMENT_COUNT_MISMATCH",
@@ -79,7 +232,6 @@ class TableData(BaseModel):
 
         # Validate number_format column indices don't exceed column count
         if self.number_format is not None:
-            column_count = self.get_column_count()
             for col_index in self.number_format.keys():
                 if col_index >= column_count:
                     raise TableValidationError(
@@ -89,7 +241,6 @@ class TableData(BaseModel):
 
         # Validate highlight_rows indices don't exceed row count
         if self.highlight_rows is not None:
-            row_count = self.get_row_count()
             for row_index in self.highlight_rows.keys():
                 if row_index >= row_count:
                     raise TableValidationError(
@@ -99,7 +250,6 @@ class TableData(BaseModel):
 
         # Validate highlight_columns indices don't exceed column count
         if self.highlight_columns is not None:
-            column_count = self.get_column_count()
             for col_index in self.highlight_columns.keys():
                 if col_index >= column_count:
                     raise TableValidationError(
@@ -107,56 +257,47 @@ class TableData(BaseModel):
                         f"Column index {col_index} exceeds number of columns ({column_count})",
                     )
 
-        # Validate sort_by references valid columns
+        # Validate sort_by structure and column references in a single pass
         if self.sort_by is not None:
             specs = self.sort_by if isinstance(self.sort_by, list) else [self.sort_by]
-            column_count = self.get_column_count()
             header_row = self.rows[0] if self.has_header else None
+            # Column name -> first matching index; only string cells can match
+            header_index: Optional[Dict[str, int]] = None
+            if header_row:
+                header_index = {}
+                for i, cell in enumerate(header_row):
+                    if isinstance(cell, str):
+                        header_index.setdefault(cell, i)
 
             for spec in specs:
-                # Extract column from spec
-                if isinstance(spec, str):
+                handler = _SORT_SPEC_HANDLERS.get(type(spec), _sort_spec_column)
+                col = handler(spec)
+
+                if isinstance(col, str):
                     # Column name - requires header
-                    if not self.has_header or not header_row:
+                    if header_index is None:
                         raise TableValidationError(
                             "INVALID_SORT",
                             "Sorting by column name requires has_header=True",
                         )
-                    if spec not in header_row:
-                        raise TableValidationError(
-                            "INVALID_SORT",
-                            f"Sort column '{spec}' not found in header row",
-                        )
-                elif isinstance(spec, int):
-                    # Column index
-                    if spec >= column_count:
+                    if col not in header_index:
                         raise TableValidationError(
                             "INVALID_SORT",
-                            f"Sort column index {spec} exceeds number of columns ({column_count})",
+                            f"Sort column '{col}' not found in header row",
                         )
-                elif isinstance(spec, dict):
-                    col = spec["column"]
-                    if isinstance(col, str):
-                        if not self.has_header or not header_row:
-                            raise TableValidationError(
-                                "INVALID_SORT",
-                                "Sorting by column name requires has_header=True",
-                            )
-                        if col not in header_row:
-                            raise TableValidationError(
-                                "INVALID_SORT",
-                                f"Sort column '{col}' not found in header row",
-                            )
-                    elif isinstance(col, int):
-                        if col >= column_count:
-                            raise TableValidationError(
-                                "INVALID_SORT",
-                                f"Sort column index {col} exceeds number of columns ({column_count})",
-                            )
+                elif col < 0:
+                    raise TableValidationError(
+                        "INVALID_SORT",
+                        f"Sort column index must be non-negative. Got: {col}",
+                    )
+                elif col >= column_count:
+                    raise TableValidationError(
+                        "INVALID_SORT",
+                        f"Sort column index {col} exceeds number of columns ({column_count})",
+                    )
 
         # Validate column_widths indices don't exceed column count
         if self.column_widths is not None:
-            column_count = self.get_column_count()
             for col_index in self.column_widths.keys():
                 if col_index >= column_count:
                     raise TableValidationError(
@@ -170,13 +311,13 @@ class TableData(BaseModel):
     @classmethod
     def validate_width(cls, v: str) -> str:
         """Validate width parameter."""
-        if v not in ["auto", "full"] and not v.endswith("%"):
+        if v not in _WIDTH_KEYWORDS and not v.endswith("%"):
             raise TableValidationError(
                 "INVALID_WIDTH",
                 f"Width must be 'auto', 'full', or a percentage (e.g., '80%'). Got: {v}",
             )
 
-        if v.endswith("%"):
+        if v.endswith("%") and _PCT_INT_RE.fullmatch(v) is None:
             try:
                 percent = int(v[:-1])
                 if percent < 1 or percent > 100:
@@ -193,13 +334,13 @@ class TableData(BaseModel):
         if v is None:
             return v
 
-        valid_alignments = ["left", "center", "right"]
-        for alignment in v:
-            if alignment not in valid_alignments:
-                raise TableValidationError(
-                    "INVALID_ALIGNMENT",
-                    f"Alignment must be one of {valid_alignments}. Got: {alignment}",
-                )
+        # One set operation on the success path; find the culprit only on failure
+        if not _VALID_ALIGNMENTS.issuperset(v):
+            alignment = next(a for a in v if a not in _VALID_ALIGNMENTS)
+            raise TableValidationError(
+                "INVALID_ALIGNMENT",
+                f"Alignment must be one of {list(_ALIGNMENTS)}. Got: {alignment}",
+            )
 
         return v
 
@@ -207,11 +348,10 @@ class TableData(BaseModel):
     @classmethod
     def validate_border_style(cls, v: str) -> str:
         """Validate border style."""
-        valid_styles = ["full", "horizontal", "minimal", "none"]
-        if v not in valid_styles:
+        if v not in _VALID_BORDER_STYLES:
             raise TableValidationError(
                 "INVALID_BORDER_STYLE",
-                f"Border style must be one of {valid_styles}. Got: {v}",
+                f"Border style must be one of {list(_BORDER_STYLES)}. Got: {v}",
             )
 
         return v
@@ -220,36 +360,7 @@ class TableData(BaseModel):
     @classmethod
     def validate_number_format(cls, v: Optional[Dict[int, str]]) -> Optional[Dict[int, str]]:
         """Validate number format specifications."""
-        if v is None:
-            return v
-
-        # Validate each format specification
-        for col_index, format_spec in v.items():
-            # Convert string keys to integers (from JSON serialization)
-            if isinstance(col_index, str):
-                try:
-                    col_index = int(col_index)
-                except ValueError:
-                    raise TableValidationError(
-                        "INVALID_NUMBER_FORMAT",
-                        f"Column index must be a non-negative integer. Got: {col_index}",
-                    )
-
-            # Validate column index is non-negative
-            if not isinstance(col_index, int) or col_index < 0:
-                raise TableValidationError(
-                    "INVALID_NUMBER_FORMAT",
-                    f"Column index must be a non-negative integer. Got: {col_index}",
-                )
-
-            # Validate format specification
-            if not validate_format_spec(format_spec):
-                raise TableValidationError(
-                    "INVALID_NUMBER_FORMAT",
-                    f"Invalid format specification for column {col_index}: {format_spec}",
-                )
-
-        return v
+        return _validate_index_keyed(v, "INVALID_NUMBER_FORMAT", "Column", _check_format_spec)
 
     @field_validator("header_color")
     @classmethod
@@ -258,7 +369,7 @@ class TableData(BaseModel):
         if v is None:
             return v
 
-        if not validate_color(v):
+        if not _color_ok(v):
             raise TableValidationError(
                 "INVALID_COLOR",
                 f"Invalid header color. Must be theme color (blue, orange, etc.) or hex color. Got: {v}",
@@ -273,7 +384,7 @@ class TableData(BaseModel):
         if v is None:
             return v
 
-        if not validate_color(v):
+        if not _color_ok(v):
             raise TableValidationError(
                 "INVALID_COLOR",
                 f"Invalid stripe color. Must be theme color (blue, orange, etc.) or hex color. Got: {v}",
@@ -285,186 +396,35 @@ class TableData(BaseModel):
     @classmethod
     def validate_highlight_rows(cls, v: Optional[Dict[int, str]]) -> Optional[Dict[int, str]]:
         """Validate highlight rows."""
-        if v is None:
-            return v
-
-        for row_index, color in v.items():
-            # Convert string keys to integers (from JSON serialization)
-            if isinstance(row_index, str):
-                try:
-                    row_index = int(row_index)
-                except ValueError:
-                    raise TableValidationError(
-                        "INVALID_HIGHLIGHT",
-                        f"Row index must be a non-negative integer. Got: {row_index}",
-                    )
-
-            # Validate row index is non-negative
-            if not isinstance(row_index, int) or row_index < 0:
-                raise TableValidationError(
-                    "INVALID_HIGHLIGHT",
-                    f"Row index must be a non-negative integer. Got: {row_index}",
-                )
-
-            # Validate color
-            if not validate_color(color):
-                raise TableValidationError(
-                    "INVALID_COLOR",
-                    f"Invalid color for row {row_index}. Must be theme color or hex color. Got: {color}",
-                )
-
-        return v
+        return _validate_index_keyed(v, "INVALID_HIGHLIGHT", "Row", _check_row_color)
 
     @field_validator("highlight_columns")
     @classmethod
     def validate_highlight_columns(cls, v: Optional[Dict[int, str]]) -> Optional[Dict[int, str]]:
         """Validate highlight columns."""
-        if v is None:
-            return v
-
-        for col_index, color in v.items():
-            # Convert string keys to integers (from JSON serialization)
-            if isinstance(col_index, str):
-                try:
-                    col_index = int(col_index)
-                except ValueError:
-                    raise TableValidationError(
-                        "INVALID_HIGHLIGHT",
-                        f"Column index must be a non-negative integer. Got: {col_index}",
-                    )
-
-            # Validate column index is non-negative
-            if not isinstance(col_index, int) or col_index < 0:
-                raise TableValidationError(
-                    "INVALID_HIGHLIGHT",
-                    f"Column index must be a non-negative integer. Got: {col_index}",
-                )
-
-            # Validate color
-            if not validate_color(color):
-                raise TableValidationError(
-                    "INVALID_COLOR",
-                    f"Invalid color for column {col_index}. Must be theme color or hex color. Got: {color}",
-                )
-
-        return v
-
-    @field_validator("sort_by")
-    @classmethod
-    def validate_sort_by(cls, v: Optional[Any]) -> Optional[Any]:
-        """Validate sort_by parameter."""
-        if v is None:
-            return v
-
-        # Normalize to list
-        specs = v if isinstance(v, list) else [v]
-
-        for spec in specs:
-            if isinstance(spec, str):
-                # Column name - will be validated against header later
-                pass
-            elif isinstance(spec, int):
-                # Column index - will be validated against column count later
-                if spec < 0:
-                    raise TableValidationError(
-                        "INVALID_SORT",
-                        f"Sort column index must be non-negative. Got: {spec}",
-                    )
-            elif isinstance(spec, dict):
-                # Validate dict structure
-                if "column" not in spec:
-                    raise TableValidationError(
-                        "INVALID_SORT",
-                        "Sort specification dict must have 'column' key",
-                    )
-
-                col = spec["column"]
-                if not isinstance(col, (str, int)):
-                    raise TableValidationError(
-                        "INVALID_SORT",
-                        f"Sort column must be string or int. Got: {type(col).__name__}",
-                    )
-
-                if isinstance(col, int) and col < 0:
-                    raise TableValidationError(
-                        "INVALID_SORT",
-                        f"Sort column index must be non-negative. Got: {col}",
-                    )
-
-                # Validate order if present
-                if "order" in spec:
-                    order = spec["order"]
-                    if order not in ["asc", "desc"]:
-                        raise TableValidationError(
-                            "INVALID_SORT",
-                            f"Sort order must be 'asc' or 'desc'. Got: {order}",
-                        )
-            else:
-                raise TableValidationError(
-                    "INVALID_SORT",
-                    f"Sort specification must be string, int, or dict. Got: {type(spec).__name__}",
-                )
-
-        return v
+        return _validate_index_keyed(v, "INVALID_HIGHLIGHT", "Column", _check_column_color)
 
     @field_validator("column_widths")
     @classmethod
     def validate_column_widths(cls, v: Optional[Dict[int, str]]) -> Optional[Dict[int, str]]:
         """Validate column_widths parameter."""
-        if v is None:
-            return v
-
-        total_percentage = 0
-        for col_index, width_str in v.items():
-            # Convert string keys to integers (JSON serialization converts int keys to strings)
-            if isinstance(col_index, str):
-                try:
-                    col_index = int(col_index)
-                except ValueError:
-                    raise TableValidationError(
-                        "INVALID_COLUMN_WIDTH",
-                        f"Column index must be a non-negative integer. Got: {col_index}",
-                    )
-
-            # Validate column index
-            if not isinstance(col_index, int) or col_index < 0:
-                raise TableValidationError(
-                    "INVALID_COLUMN_WIDTH",
-                    f"Column index must be a non-negative integer. Got: {col_index}",
-                )
-
-            # Validate percentage format
-            if not isinstance(width_str, str) or not width_str.endswith("%"):
-                raise TableValidationError(
-                    "INVALID_COLUMN_WIDTH",
-                    f"Column width must be a percentage string (e.g., '25%'). Got: {width_str}",
-                )
-
-            # Extract and validate percentage value
-            try:
-                percentage = float(width_str[:-1])
-            except ValueError:
-                raise TableValidationError(
-                    "INVALID_COLUMN_WIDTH",
-                    f"Invalid percentage format: {width_str}",
-                )
-
-            if percentage <= 0 or percentage > 100:
-                raise TableValidationError(
-                    "INVALID_COLUMN_WIDTH",
-                    f"Column width percentage must be between 0 and 100. Got: {percentage}%",
-                )
-
-            total_percentage += percentage
+        percentages: List[float] = []
+        normalized = _validate_index_keyed(
+            v,
+            "INVALID_COLUMN_WIDTH",
+            "Column",
+            lambda _, width_str: percentages.append(_parse_column_width(width_str)),
+        )
 
         # Validate total doesn't exceed 100%
+        total_percentage = sum(percentages)
         if total_percentage > 100:
             raise TableValidationError(
                 "INVALID_COLUMN_WIDTH",
                 f"Total column widths ({total_percentage}%) exceed 100%",
             )
 
-        return v
+        return normalized
 
     def get_column_count(self) -> int:
         """Get the number of columns in the table."""
@@ -487,11 +447,13 @@ class TableData(BaseModel):
         return None
 
 
-def validate_table_data(data: Dict[str, Any]) -> TableData:
+def validate_table_data(data: Union[Dict[str, Any], TableData]) -> TableData:
     """Validate table data and return TableData model.
 
+    A TableData instance has already been validated and is returned as is.
+
     Args:
-        data: Dictionary containing table parameters
+        data: Dictionary containing table parameters, or a TableData
 
     Returns:
         TableData: Validated table data model
@@ -499,6 +461,8 @@ def validate_table_data(data: Dict[str, Any]) -> TableData:
     Raises:
         TableValidationError: If validation fails
     """
+    if isinstance(data, TableData):
+        return data
     try:
         return TableData(**data)
     except TableValidationError:
@@ -8,20 +8,110 @@ Does NOT implement session lifecycle - use MCP server for session workflows.
 Authentication via X-Auth-Token header (group:token format) or Authorization Bearer.
 """
 
-from fastapi import FastAPI, HTTPException, Header, Request
+from fastapi import Depends, FastAPI, HTTPException, Header, Request
 from fastapi.responses import FileResponse, JSONResponse, Response
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.rendering.engine import RenderingEngine
 from app.templates.registry import TemplateRegistry
 from app.fragments.registry import FragmentRegistry
 from app.styles.registry import StyleRegistry
 from app.sessions import SessionManager, SessionStore
-from app.validation.document_models import OutputFormat
+from app.validation.document_models import OutputFormat, parse_output_format
 from app.logger import Logger, session_logger
 from app.config import get_default_images_dir, get_default_sessions_dir
 from datetime import datetime
-from typing import Optional, Dict, Any
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Response media type per rendered format (OutputFormat.MD aliases MARKDOWN)
+_MEDIA_TYPES: Dict[OutputFormat, str] = {
+    OutputFormat.HTML: "text/html",
+    OutputFormat.MARKDOWN: "text/markdown",
+    OutputFormat.PDF: "application/pdf",
+}
+
+
+class RenderRequest(BaseModel):
+    """Request body for POST /render/{session_id}."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    format: OutputFormat = Field(
+        OutputFormat.HTML, description="Output format: html, markdown, or pdf"
+    )
+    style_id: Optional[str] = None
+    proxy: bool = False
+
+    @field_validator("format", mode="before")
+    @classmethod
+    def parse_format(cls, v: Any) -> Any:
+        """Accept any casing and the 'md' alias; unknown values fail with 422."""
+        if isinstance(v, str):
+            return parse_output_format(v.lower())
+        return v
+
+
+class _OrjsonResponse(JSONResponse):
+    """JSONResponse encoded with orjson; same compact UTF-8 output as Starlette's."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Placeholder Content-Encoding that makes GZipMiddleware pass a response through;
+# "identity" is never a real Content-Encoding, so it is always stripped again
+_NO_GZIP_HEADER = (b"content-encoding", b"identity")
+
+
+def _is_precompressed(media_type: str) -> bool:
+    """PDF and image bodies are already compressed; gzip only costs CPU on them."""
+    return media_type == "application/pdf" or media_type.startswith("image/")
+
+
+class _MediaTypeGZipMiddleware:
+    """GZipMiddleware that leaves PDF and image responses uncompressed.
+
+    Starlette's GZipMiddleware has no media type exclusions before its newer
+    releases, but every version passes through a response that already has a
+    Content-Encoding. Excluded responses get a placeholder one on the way in,
+    removed again on the way out.
+    """
+
+    def __init__(self, app: ASGIApp, **gzip_options: Any) -> None:
+        self.app = app
+        self.gzip = GZipMiddleware(self._mark_precompressed, **gzip_options)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_unmarked(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = message["headers"]
+                if _NO_GZIP_HEADER in headers:
+                    message["headers"] = [h for h in headers if h != _NO_GZIP_HEADER]
+            await send(message)
+
+        await self.gzip(scope, receive, send_unmarked)
+
+    async def _mark_precompressed(self, scope: Scope, receive: Receive, send: Send) -> None:
+        async def send_marked(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                media_type = headers.get("content-type", "").partition(";")[0].strip().lower()
+                if "content-encoding" not in headers and _is_precompressed(media_type):
+                    message = {**message, "headers": [*message["headers"], _NO_GZIP_HEADER]}
+            await send(message)
+
+        await self.app(scope, receive, send_marked)
+
 
 class GofrDocWebServer:
     """FastAPI web server for document discovery and rendering only."""
@@ -75,6 +165,9 @@ class GofrDocWebServer:
         self.app = FastAPI(
             title="gofr-doc", description="Document discovery and rendering REST API"
         )
+        # Listings and HTML/Markdown renders are text and compress well; bodies
+        # under 1 KiB (ping, errors), PDFs and images are sent as-is
+        self.app.add_middleware(_MediaTypeGZipMiddleware, minimum_size=1024, compresslevel=5)
 
         # Set up registries
         project_root = Path(__file__).parent.parent.parent
@@ -109,6 +202,15 @@ class GofrDocWebServer:
             logger=session_logger,
         )
 
+        # Serialized discovery listings keyed by (kind, group). Registries are
+        # loaded once at startup and never reloaded, so a listing cannot change
+        # for the life of the server.
+        self._listing_cache: Dict[Tuple[str, Optional[str]], Tuple[int, bytes]] = {}
+        # /ping body as (monotonic refresh time, timestamp, JSON body); probes
+        # only need second-level timestamps, so it is re-serialized at most once
+        # a second
+        self._ping_cache: Tuple[float, str, bytes] = (float("-inf"), "", b"")
+
         self.require_auth = require_auth
         self.auth_service = auth_service
         self.logger: Logger = session_logger
@@ -255,6 +357,36 @@ class GofrDocWebServer:
 
         return resolved
 
+    def _listing_body(
+        self, key: Tuple[str, Optional[str]], build_items: Callable[[], List[Dict[str, Any]]]
+    ) -> Tuple[int, bytes]:
+        """Return (count, JSON body) for a discovery listing, serializing it once.
+
+        Empty listings are not cached so unknown group names cannot grow the cache.
+        """
+        cached = self._listing_cache.get(key)
+        if cached is not None:
+            return cached
+
+        items = build_items()
+        entry = (
+            len(items),
+            orjson.dumps({"status": "success", "data": items}, option=orjson.OPT_NON_STR_KEYS),
+        )
+        if items:
+            self._listing_cache[key] = entry
+        return entry
+
+    def _ping_body(self) -> Tuple[str, bytes]:
+        """Return (timestamp, JSON body) for /ping, refreshed at most once per second."""
+        refreshed_at, timestamp, body = self._ping_cache
+        now = time.monotonic()
+        if now - refreshed_at >= 1.0:
+            timestamp = datetime.now().isoformat()
+            body = orjson.dumps({"status": "ok", "timestamp": timestamp, "service": "gofr-doc"})
+            self._ping_cache = (now, timestamp, body)
+        return timestamp, body
+
     def _content_type_for(self, path: Path) -> str:
         """Return the MIME type for an image file based on its extension."""
         return self._IMAGE_MIME_TYPES.get(path.suffix.lower(), "application/octet-stream")
@@ -262,6 +394,22 @@ class GofrDocWebServer:
     def _setup_routes(self):
         """Set up all API routes for discovery and document rendering."""
 
+        # Collaborators are fixed after __init__; bind the per-request calls
+        # once so route closures skip the self.<attr>.<method> lookups
+        resolve_session = self.session_manager.resolve_session
+        get_session = self.session_manager.get_session
+        render_document = self.engine.render_document
+        load_proxy_document = self.engine.get_proxy_document
+
+        async def resolve_auth_group(
+            x_auth_token: Optional[str] = Header(None),
+            authorization: Optional[str] = Header(None),
+        ) -> Optional[str]:
+            return self._verify_auth_header(x_auth_token, authorization)
+
+        # One shared dependency marker for every authenticated route
+        auth_group_dependency = Depends(resolve_auth_group)
+
         # ====================================================================
         # DISCOVERY ENDPOINTS (no auth required)
         # ====================================================================
@@ -274,11 +422,9 @@ class GofrDocWebServer:
             Returns:
                 {status: "ok", timestamp: ISO8601, service: "gofr-doc"}
             """
-            current_time = datetime.now().isoformat()
+            current_time, body = self._ping_body()
             self.logger.info("GET /ping", timestamp=current_time)
-            result = JSONResponse(
-                content={"status": "ok", "timestamp": current_time, "service": "gofr-doc"}
-            )
+            result = Response(content=body, media_type="application/json")
             self.logger.info("/ping completed", status=200)
             return result
 
@@ -287,22 +433,20 @@ class GofrDocWebServer:
             """List available templates."""
             self.logger.info("GET /templates", group=group or "(all)")
             try:
-                templates = self.template_registry.list_templates(group=group)
-                self.logger.info("/templates completed", count=len(templates), status=200)
-                return JSONResponse(
-                    content={
-                        "status": "success",
-                        "data": [
-                            {
-                                "template_id": t.template_id,
-                                "name": t.name,
-                                "description": t.description,
-                                "group": t.group,
-                            }
-                            for t in templates
-                        ],
-                    }
+                count, body = self._listing_body(
+                    ("templates", group),
+                    lambda: [
+                        {
+                            "template_id": t.template_id,
+                            "name": t.name,
+                            "description": t.description,
+                            "group": t.group,
+                        }
+                        for t in self.template_registry.list_templates(group=group)
+                    ],
                 )
+                self.logger.info("/templates completed", count=count, status=200)
+                return Response(content=body, media_type="application/json")
             except Exception as e:
                 self.logger.error(
                     "/templates failed",
@@ -328,7 +472,7 @@ class GofrDocWebServer:
                         },
                     )
 
-                return JSONResponse(
+                return _OrjsonResponse(
                     content={
                         "status": "success",
                         "data": {
@@ -362,7 +506,12 @@ class GofrDocWebServer:
             except HTTPException:
                 raise
             except Exception as e:
-                self.logger.error(f"Error getting template details: {str(e)}")
+                self.logger.error(
+                    "Error getting template details",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    status=500,
+                )
                 raise HTTPException(status_code=500, detail=str(e))
 
         @self.app.get("/templates/{template_id}/fragments")
@@ -380,25 +529,28 @@ class GofrDocWebServer:
                         },
                     )
 
-                fragments = self.fragment_registry.list_fragments()
-                return JSONResponse(
-                    content={
-                        "status": "success",
-                        "data": [
-                            {
-                                "fragment_id": f["fragment_id"],
-                                "name": f["name"],
-                                "description": f["description"],
-                                "group": f["group"],
-                            }
-                            for f in fragments
-                        ],
-                    }
+                _, body = self._listing_body(
+                    ("fragments", None),
+                    lambda: [
+                        {
+                            "fragment_id": f["fragment_id"],
+                            "name": f["name"],
+                            "description": f["description"],
+                            "group": f["group"],
+                        }
+                        for f in self.fragment_registry.list_fragments()
+                    ],
                 )
+                return Response(content=body, media_type="application/json")
             except HTTPException:
                 raise
             except Exception as e:
-                self.logger.error(f"Error listing fragments: {str(e)}")
+                self.logger.error(
+                    "Error listing fragments",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    status=500,
+                )
                 raise HTTPException(status_code=500, detail=str(e))
 
         @self.app.get("/fragments/{fragment_id}")
@@ -418,7 +570,7 @@ class GofrDocWebServer:
                         },
                     )
 
-                return JSONResponse(
+                return _OrjsonResponse(
                     content={
                         "status": "success",
                         "data": {
@@ -442,7 +594,12 @@ class GofrDocWebServer:
             except HTTPException:
                 raise
             except Exception as e:
-                self.logger.error(f"Error getting fragment details: {str(e)}")
+                self.logger.error(
+                    "Error getting fragment details",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    status=500,
+                )
                 raise HTTPException(status_code=500, detail=str(e))
 
         @self.app.get("/styles")
@@ -450,31 +607,38 @@ class GofrDocWebServer:
             """List available styles."""
             self.logger.info("List styles request", group=group)
             try:
-                styles = self.style_registry.list_styles(group=group)
-                return JSONResponse(
-                    content={
-                        "status": "success",
-                        "data": [
-                            {
-                                "style_id": s.style_id,
-                                "name": s.name,
-                                "description": s.description,
-                                "group": s.group,
-                            }
-                            for s in styles
-                        ],
-                    }
+                _, body = self._listing_body(
+                    ("styles", group),
+                    lambda: [
+                        {
+                            "style_id": s.style_id,
+                            "name": s.name,
+                            "description": s.description,
+                            "group": s.group,
+                        }
+                        for s in self.style_registry.list_styles(group=group)
+                    ],
                 )
+                return Response(content=body, media_type="application/json")
             except Exception as e:
-                self.logger.error(f"Error listing styles: {str(e)}")
+                self.logger.error(
+                    "Error listing styles",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    status=500,
+                )
                 raise HTTPException(status_code=500, detail=str(e))
 
         # ====================================================================
         # STOCK IMAGE ENDPOINTS (no auth required)
         # ====================================================================
 
+        # Plain def: the directory walk is blocking disk I/O, so FastAPI runs
+        # this handler in its threadpool instead of on the event loop. The
+        # discovery routes above stay async; they only read registry state
+        # loaded at startup and never touch the disk per request.
         @self.app.get("/images")
-        async def list_images():
+        def list_images():
             """
             List all available stock images.
 
@@ -501,7 +665,7 @@ class GofrDocWebServer:
                     count=len(image_paths),
                     status=200,
                 )
-                return JSONResponse(
+                return _OrjsonResponse(
                     content={
                         "status": "success",
                         "data": {
@@ -571,9 +735,8 @@ class GofrDocWebServer:
         async def get_document(
             session_id: str,
             request: Request,
-            body: Optional[Dict[str, Any]] = None,
-            x_auth_token: Optional[str] = Header(None),
-            authorization: Optional[str] = Header(None),
+            body: Optional[RenderRequest] = None,
+            auth_group: Optional[str] = auth_group_dependency,
         ):
             """
             Render a finalized document session to the specified format.
@@ -593,14 +756,13 @@ class GofrDocWebServer:
             - Markdown format: Response with media_type="text/markdown"
             - Proxy mode: JSON with proxy_guid field
             """
-            auth_group = self._verify_auth_header(x_auth_token, authorization)
-
             if body is None:
-                body = {}
+                body = RenderRequest()
 
-            output_format = body.get("format", "html").lower()
-            style_id = body.get("style_id")
-            proxy = body.get("proxy", False)
+            output_format_obj = body.format
+            output_format = output_format_obj.value
+            style_id = body.style_id
+            proxy = body.proxy
 
             self.logger.info(
                 "POST /render/{id}",
@@ -613,9 +775,7 @@ class GofrDocWebServer:
 
             try:
                 # Resolve alias to GUID if needed
-                resolved_session_id = self.session_manager.resolve_session(
-                    auth_group or "public", session_id
-                )
+                resolved_session_id = resolve_session(auth_group or "public", session_id)
                 if not resolved_session_id:
                     # If not found as alias, try as direct GUID
                     if self.session_manager._is_valid_uuid(session_id):
@@ -630,7 +790,7 @@ class GofrDocWebServer:
                         )
 
                 # Get the session
-                session = await self.session_manager.get_session(resolved_session_id)
+                session = await get_session(resolved_session_id)
                 if not session:
                     raise HTTPException(
                         status_code=404,
@@ -651,11 +811,15 @@ class GofrDocWebServer:
                     )
 
                 # Render the document
-                output_format_obj = OutputFormat(output_format)
-                output_obj = await self.engine.render_document(
+                output_obj = await render_document(
                     session=session, output_format=output_format_obj, style_id=style_id, proxy=proxy
                 )
 
+                # Encode once: the byte length is both the logged size and the
+                # Content-Length header, so Response does not measure it again
+                content_bytes = output_obj.content.encode("utf-8") if output_obj.content else b""
+                output_size = len(content_bytes)
+
                 self.logger.info(
                     "/render completed successfully",
                     session_id=resolved_session_id,
@@ -663,7 +827,7 @@ class GofrDocWebServer:
                     format=output_format,
                     proxy=proxy,
                     proxy_guid=output_obj.proxy_guid if proxy else None,
-                    output_size=len(output_obj.content) if output_obj.content else 0,
+                    output_size=output_size,
                     status=200,
                 )
 
@@ -671,7 +835,7 @@ class GofrDocWebServer:
                 if proxy:
                     # Proxy mode: return GUID and download URL instead of content
                     download_url = f"{request.url.scheme}://{request.headers.get('host', 'localhost:8000')}/proxy/{output_obj.proxy_guid}"
-                    return JSONResponse(
+                    return _OrjsonResponse(
                         content={
                             "status": "success",
                             "data": {
@@ -684,20 +848,20 @@ class GofrDocWebServer:
                     )
                 else:
                     # Direct render: return content with appropriate media type
-                    if output_format_obj == OutputFormat.HTML:
-                        return Response(content=output_obj.content, media_type="text/html")
-                    elif output_format_obj in (OutputFormat.MARKDOWN, OutputFormat.MD):
-                        return Response(content=output_obj.content, media_type="text/markdown")
-                    elif output_format_obj == OutputFormat.PDF:
-                        return Response(content=output_obj.content, media_type="application/pdf")
-                    else:
-                        # Fallback: return as JSON
-                        return JSONResponse(
-                            content={
-                                "status": "success",
-                                "data": {"format": output_format, "content": output_obj.content},
-                            }
+                    media_type = _MEDIA_TYPES.get(output_format_obj)
+                    if media_type is not None:
+                        return Response(
+                            content=content_bytes,
+                            media_type=media_type,
+                            headers={"Content-Length": str(output_size)},
                         )
+                    # Fallback: return as JSON
+                    return _OrjsonResponse(
+                        content={
+                            "status": "success",
+                            "data": {"format": output_format, "content": output_obj.content},
+                        }
+                    )
 
             except HTTPException as e:
                 self.logger.error(
@@ -733,16 +897,14 @@ class GofrDocWebServer:
         @self.app.get("/proxy/{proxy_guid}")
         async def get_proxy_document(
             proxy_guid: str,
-            x_auth_token: Optional[str] = Header(None),
-            authorization: Optional[str] = Header(None),
+            auth_group: Optional[str] = auth_group_dependency,
         ):
             """
             Retrieve a previously stored proxy document.
 
             Args:
                 proxy_guid: The proxy document GUID
-                x_auth_token: Optional authentication token (X-Auth-Token format)
-                authorization: Optional authentication token (Bearer format)
+                auth_group: Group from the X-Auth-Token or Authorization header, if any
 
             Returns:
                 Document content with appropriate media type based on format
@@ -751,15 +913,13 @@ class GofrDocWebServer:
                 Group ownership is verified against the stored group metadata in the proxy
                 document, not from URL parameters. This prevents group parameter injection attacks.
             """
-            auth_group = self._verify_auth_header(x_auth_token, authorization)
-
             self.logger.info(
                 "GET /proxy/{guid}", proxy_guid=proxy_guid, auth_group=auth_group or "(none)"
             )
 
             try:
                 # Retrieve the proxy document (reads stored group from metadata)
-                output_obj = await self.engine.get_proxy_document(proxy_guid)
+                output_obj = await load_proxy_document(proxy_guid)
                 stored_group = output_obj.group
 
                 self.logger.info(
@@ -787,16 +947,11 @@ class GofrDocWebServer:
                     size=len(output_obj.content) if output_obj.content else 0,
                 )
 
-                # Return content with appropriate media type
-                if output_obj.format == OutputFormat.HTML:
-                    return Response(content=output_obj.content, media_type="text/html")
-                elif output_obj.format in (OutputFormat.MARKDOWN, OutputFormat.MD):
-                    return Response(content=output_obj.content, media_type="text/markdown")
-                elif output_obj.format == OutputFormat.PDF:
-                    return Response(content=output_obj.content, media_type="application/pdf")
-                else:
-                    # Fallback: return as text
-                    return Response(content=output_obj.content, media_type="text/plain")
+                # Return content with appropriate media type (fallback: plain text)
+                return Response(
+                    content=output_obj.content,
+                    media_type=_MEDIA_TYPES.get(output_obj.format, "text/plain"),
+                )
 
             except HTTPException:
                 raise
@@ -814,7 +969,12 @@ class GofrDocWebServer:
                 else:
                     raise HTTPException(status_code=400, detail=error_msg)
             except Exception as e:
-                self.logger.error(f"Error retrieving proxy document: {str(e)}")
+                self.logger.error(
+                    "Error retrieving proxy document",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    status=500,
+                )
                 raise HTTPException(
                     status_code=500,
                     detail={
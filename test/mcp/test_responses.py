@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Test MCP tool response serialization"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import json
+
+from pydantic import BaseModel
+
+from app.mcp_server.responses import _json_dumps
+
+
+class _Point(BaseModel):
+    x: float
+
+
+def test_ascii_payload_matches_json_dumps():
+    """Plain payloads serialize exactly as json.dumps(indent=2) did"""
+    payload = {"status": "success", "data": {"count": 2, "items": ["a", None, True], "ratio": 0.5}}
+
+    assert _json_dumps(payload) == json.dumps(payload, indent=2)
+
+
+def test_non_finite_floats_keep_json_dumps_form():
+    """NaN and infinity are written as json.dumps writes them, not as null"""
+    payload = {"data": {"values": [1.0, float("nan"), float("inf")], "missing": None}}
+
+    assert _json_dumps(payload) == json.dumps(payload, indent=2)
+
+
+def test_non_finite_float_inside_model_is_detected():
+    """NaN reached through a Pydantic model is not turned into null"""
+    text = _json_dumps({"data": _Point(x=float("nan")), "error": None})
+
+    assert '"x": NaN' in text
+
+
+def test_exponent_floats_round_trip():
+    """Exponent floats may be spelled differently but parse to the same value"""
+    payload = {"data": {"big": 1e16, "small": 1e-7}}
+
+    assert json.loads(_json_dumps(payload)) == payload
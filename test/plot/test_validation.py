@@ -145,3 +145,9 @@ class TestValidatorErrorStructure:
         result = self.validator.validate(params)
         error_dict = result.errors[0].to_dict()
         assert isinstance(error_dict["suggestions"], list)
+
+    def test_result_json_errors(self):
+        params = GraphParams(title="Test", y1=[1], type="pie")
+        result = self.validator.validate(params)
+        json_errors = result.get_json_errors()
+        assert json_errors == [err.to_dict() for err in result.errors]
@@ -492,6 +492,76 @@ class TestOutputFormatValidation:
             assert "successfully" in output.message.lower()
 
 
+class TestRenderCache:
+    """Test that identical renders are served from the engine's render cache."""
+
+    @staticmethod
+    def _session(session_id, title="Test", fragments=None):
+        return DocumentSession(
+            session_id=session_id,
+            template_id="basic_report",
+            group="public",
+            global_parameters={"title": title},
+            fragments=fragments or [],
+            created_at="2025-11-16T00:00:00",
+            updated_at="2025-11-16T00:00:00",
+        )
+
+    @pytest.mark.asyncio
+    async def test_identical_render_skips_pipeline(self, rendering_engine, mock_style_registry):
+        """Test that a repeat render with the same content does not re-render."""
+        first = await rendering_engine.render_document(self._session("cache-1"), OutputFormat.HTML)
+        second = await rendering_engine.render_document(self._session("cache-2"), OutputFormat.HTML)
+
+        assert second.content == first.content
+        assert second.session_id == "cache-2"
+        assert mock_style_registry.get_style_css.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_parameters_render_fresh(self, rendering_engine):
+        """Test that different parameters or fragments are not served from cache."""
+        base = await rendering_engine.render_document(self._session("cache-3"), OutputFormat.HTML)
+        retitled = await rendering_engine.render_document(
+            self._session("cache-3", title="Other"), OutputFormat.HTML
+        )
+        with_fragment = await rendering_engine.render_document(
+            self._session(
+                "cache-3",
+                fragments=[{"fragment_id": "paragraph", "parameters": {"text": "Hello"}}],  # type: ignore[list-item] - test uses simplified dict
+            ),
+            OutputFormat.HTML,
+        )
+
+        assert "Other" in retitled.content
+        assert "Hello" in with_fragment.content
+        assert len({base.content, retitled.content, with_fragment.content}) == 3
+
+    @pytest.mark.asyncio
+    async def test_style_and_format_are_part_of_key(self, rendering_engine, mock_style_registry):
+        """Test that another style or format renders instead of hitting the cache."""
+        session = self._session("cache-4")
+        await rendering_engine.render_document(session, OutputFormat.HTML)
+        await rendering_engine.render_document(session, OutputFormat.HTML, style_id="custom")
+        markdown = await rendering_engine.render_document(session, OutputFormat.MD)
+
+        assert mock_style_registry.get_style_css.call_count == 3
+        assert "<html" not in markdown.content
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(
+        self, rendering_engine, mock_style_registry, monkeypatch
+    ):
+        """Test that the cache is bounded and drops the oldest entry first."""
+        monkeypatch.setattr("app.rendering.engine._RENDER_CACHE_SIZE", 1)
+
+        await rendering_engine.render_document(self._session("cache-5", "A"), OutputFormat.HTML)
+        await rendering_engine.render_document(self._session("cache-5", "B"), OutputFormat.HTML)
+        await rendering_engine.render_document(self._session("cache-5", "A"), OutputFormat.HTML)
+
+        assert len(rendering_engine._render_cache) == 1
+        assert mock_style_registry.get_style_css.call_count == 3
+
+
 class TestErrorHandling:
     """Test error handling and edge cases."""
 
@@ -184,3 +184,61 @@ def test_storage_initialization_failure():
 
     assert "Failed to create storage directory" in str(exc_info.value)
     logger.info("Storage initialization failure handled correctly")
+
+
+def test_storage_durable_save_round_trip(temp_storage_dir):
+    """Test that durable saves are written through fdatasync and read back intact"""
+    storage = FileStorage(storage_dir=temp_storage_dir)
+    test_data = b"durable document data" * 1024
+
+    with patch("app.storage.file_storage.os.fdatasync", wraps=os.fdatasync) as mock_sync:
+        guid = storage.save_document(test_data, format="pdf", group="test", durable=True)
+        assert mock_sync.call_count == 1
+
+    assert storage.get_document(guid, group="test") == test_data
+    assert storage.metadata[guid]["format"] == "pdf"
+
+
+def test_storage_batch_save_writes_metadata_once(temp_storage_dir):
+    """Test that save_documents stores every item and saves metadata a single time"""
+    storage = FileStorage(storage_dir=temp_storage_dir)
+    items = [(b"first", "png"), (b"second", "JSON"), (b"third", "pdf")]
+
+    with patch.object(storage, "_save_metadata", wraps=storage._save_metadata) as mock_save:
+        guids = storage.save_documents(items, group="test", durable=True)
+        assert mock_save.call_count == 1
+
+    assert len(guids) == 3
+    for guid, (data, fmt) in zip(guids, items):
+        assert storage.get_document(guid, group="test") == data
+        assert storage.metadata[guid]["format"] == fmt.lower()
+
+
+@pytest.mark.parametrize("fail_on", ["write", "metadata"])
+def test_storage_batch_save_failure_leaves_nothing_behind(temp_storage_dir, fail_on):
+    """Test that a failed batch removes its files and forgets its metadata"""
+    storage = FileStorage(storage_dir=temp_storage_dir)
+    existing = set(os.listdir(temp_storage_dir))
+    items = [(b"first", "png"), (b"second", "json"), (b"third", "pdf")]
+
+    if fail_on == "write":
+        original_write = storage._write_file
+        calls = []
+
+        def failing_write(filepath, data, durable=False):
+            calls.append(filepath)
+            if len(calls) == 2:
+                # Simulate a write that fails after creating the file
+                filepath.write_bytes(data[:1])
+                raise OSError("disk full")
+            original_write(filepath, data, durable=durable)
+
+        patcher = patch.object(storage, "_write_file", side_effect=failing_write)
+    else:
+        patcher = patch.object(storage, "_save_metadata", side_effect=OSError("disk full"))
+
+    with patcher, pytest.raises(RuntimeError, match="disk full"):
+        storage.save_documents(items, group="test")
+
+    assert set(os.listdir(temp_storage_dir)) == existing
+    assert storage.metadata == {}
@@ -3,6 +3,8 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from app.validation.document_models import (
@@ -240,3 +242,94 @@ class TestDocumentSessionValidation:
         assert all(isinstance(f, FragmentInstance) for f in session.fragments)
         assert session.fragments[0].fragment_id == "header"
         assert session.fragments[1].parameters.get("page_number") is True
+
+
+class TestValidateParametersOutput:
+    """Test parameter validation output model"""
+
+    def test_output_accepts_validation_errors(self):
+        """ValidateParametersOutput carries the shared ValidationError model"""
+        from app.validation.document_models import (
+            ValidateParametersOutput,
+            ValidationErrorDetail,
+        )
+        from app.validation.error import ValidationError
+
+        assert ValidationErrorDetail is ValidationError
+
+        output = ValidateParametersOutput(
+            is_valid=False,
+            parameter_type="global",
+            template_id="basic_report",
+            errors=[
+                ValidationError(
+                    field="title",
+                    message="Missing required parameter 'title'",
+                    expected="string",
+                    suggestions=["Quarterly Report"],
+                )
+            ],
+            message="Found 1 validation errors",
+        )
+
+        dumped = output.model_dump(mode="json")
+        assert dumped["errors"][0]["field"] == "title"
+        assert dumped["errors"][0]["suggestions"] == ["Quarterly Report"]
+
+
+class TestToolInputValidation:
+    """Test MCP tool input model validation"""
+
+    def test_repeated_payload_reuses_instance(self):
+        """Identical hashable payloads share one frozen instance"""
+        from app.validation.document_models import GetSessionStatusInput
+
+        first = GetSessionStatusInput.model_validate({"session_id": "abc", "group": "public"})
+        second = GetSessionStatusInput.model_validate({"group": "public", "session_id": "abc"})
+        other = GetSessionStatusInput.model_validate({"session_id": "xyz"})
+
+        assert first is second
+        assert other is not first
+        assert other.session_id == "xyz"
+
+    def test_unhashable_payload_validates_normally(self):
+        """Payloads with dict values bypass the cache"""
+        from app.validation.document_models import AddFragmentInput
+
+        payload = AddFragmentInput.model_validate(
+            {"session_id": "abc", "fragment_id": "paragraph", "parameters": {"text": "hi"}}
+        )
+
+        assert payload.parameters == {"text": "hi"}
+
+    def test_payload_with_token_is_not_cached(self):
+        """Payloads carrying a bearer token are validated fresh every time"""
+        from app.validation.document_models import GetSessionStatusInput
+
+        payload = {"session_id": "abc", "token": "secret-token"}
+        first = GetSessionStatusInput.model_validate(payload)
+        second = GetSessionStatusInput.model_validate(payload)
+
+        assert first is not second
+        assert first == second
+        assert first.token == "secret-token"
+
+
+class TestParseOutputFormat:
+    """Test format string to OutputFormat conversion"""
+
+    def test_known_formats_and_md_shorthand(self):
+        """Format strings map to members; 'md' maps to markdown"""
+        from app.validation.document_models import OutputFormat, parse_output_format
+
+        assert parse_output_format("html") is OutputFormat.HTML
+        assert parse_output_format("pdf") is OutputFormat.PDF
+        assert parse_output_format("markdown") is OutputFormat.MARKDOWN
+        assert parse_output_format("md") is OutputFormat.MD
+
+    def test_unknown_format_raises_value_error(self):
+        """Unsupported formats raise ValueError like OutputFormat(value)"""
+        from app.validation.document_models import parse_output_format
+
+        with pytest.raises(ValueError):
+            parse_output_format("docx")
@@ -0,0 +1,50 @@
+"""Tests for the shared image validation HTTP client."""
+
+import asyncio
+
+import pytest
+
+import app.validation.image_validator as image_validator
+
+
+@pytest.fixture(autouse=True)
+def reset_client(monkeypatch):
+    """Start each test without a shared client."""
+    monkeypatch.setattr(image_validator, "_CLIENT", None)
+    monkeypatch.setattr(image_validator, "_CLIENT_LOOP", None)
+
+
+async def _current_client():
+    return image_validator._get_client()
+
+
+async def _client_after_closes():
+    client = image_validator._get_client()
+    # Let the scheduled close of the replaced client run
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    return client
+
+
+class TestSharedClient:
+    """Tests for reuse and replacement of the shared client."""
+
+    def test_same_loop_reuses_client(self):
+        """Test repeated calls on one loop share a client."""
+
+        async def twice():
+            return image_validator._get_client(), image_validator._get_client()
+
+        first, second = asyncio.run(twice())
+        assert first is second
+
+    def test_new_loop_closes_stale_client(self):
+        """Test the client from a finished loop is closed when replaced."""
+        stale = asyncio.run(_current_client())
+        fresh = asyncio.run(_client_after_closes())
+
+        assert fresh is not stale
+        assert stale.is_closed
+        assert not image_validator._CLOSING
+        asyncio.run(image_validator.close_image_client())
+        assert fresh.is_closed
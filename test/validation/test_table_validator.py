@@ -26,6 +26,11 @@ class TestTableDataValidation:
         assert table.get_row_count() == 3
         assert table.has_header is True
 
+    def test_validated_instance_returned_as_is(self):
+        """Test an existing TableData is not validated again."""
+        table = validate_table_data({"rows": [["A"], ["1"]]})
+        assert validate_table_data(table) is table
+
     def test_empty_rows_error(self):
         """Test that empty rows raise error."""
         data = {"rows": []}
@@ -119,6 +124,26 @@ class TestTableDataValidation:
             validate_table_data(data)
         assert exc_info.value.error_code == "INVALID_WIDTH"
 
+    @pytest.mark.parametrize("width", ["0%", "abc%", "12.5%", "%"])
+    def test_malformed_percentage_width(self, width):
+        """Test non-integer or out-of-range percentage widths."""
+        data = {"rows": [["A"]], "width": width}
+        with pytest.raises(TableValidationError) as exc_info:
+            validate_table_data(data)
+        assert exc_info.value.error_code == "INVALID_WIDTH"
+
+    @pytest.mark.parametrize("width", [" 50%", "+50%", "050%"])
+    def test_non_canonical_percentage_width(self, width):
+        """Test spellings int() accepts remain valid percentage widths."""
+        table = validate_table_data({"rows": [["A"]], "width": width})
+        assert table.width == width
+
+    @pytest.mark.parametrize("width", ["1%", "100%"])
+    def test_percentage_width_bounds(self, width):
+        """Test percentage width accepts 1% through 100%."""
+        table = validate_table_data({"rows": [["A"]], "width": width})
+        assert table.width == width
+
     def test_get_column_count(self):
         """Test get_column_count method."""
         data = {"rows": [["A", "B", "C"], ["1", "2", "3"]]}
@@ -173,6 +198,7 @@ class TestColumnAlignments:
             TableData(rows=[["A", "B"], ["1", "2"]], column_alignments=["left", "middle"])
 
         assert exc.value.error_code == "INVALID_ALIGNMENT"
+        assert "Got: middle" in exc.value.message
 
     def test_alignment_count_mismatch(self):
         """Test alignment count doesn't match column count."""
@@ -626,6 +652,17 @@ class TestSortBy:
         assert exc.value.error_code == "INVALID_SORT"
         assert "must be 'asc' or 'desc'" in exc.value.message
 
+    def test_sort_by_non_string_order(self):
+        """Test error for a sort order that is not a string."""
+        with pytest.raises(TableValidationError) as exc:
+            TableData(
+                rows=[["Name"], ["Alice"]],
+                sort_by={"column": "Name", "order": ["desc"]},
+            )
+
+        assert exc.value.error_code == "INVALID_SORT"
+        assert "must be 'asc' or 'desc'" in exc.value.message
+
     def test_sort_by_dict_missing_column(self):
         """Test error when dict missing column key."""
         with pytest.raises(TableValidationError) as exc:
@@ -658,6 +695,12 @@ class TestColumnWidths:
         assert data.column_widths[1] == "40%"
         assert data.column_widths[2] == "30%"
 
+    @pytest.mark.parametrize("width", [" 50%", "+50%", "050%", "5e1%"])
+    def test_non_canonical_column_width(self, width):
+        """Test spellings float() accepts remain valid column widths."""
+        data = TableData(rows=[["A", "B"], ["1", "2"]], column_widths={0: width})
+        assert data.column_widths == {0: width}
+
     def test_partial_column_widths(self):
         """Test partial column widths (auto-distribute remaining)."""
         data = TableData(
@@ -754,3 +797,24 @@ class TestColumnWidths:
 
         assert exc.value.error_code == "INVALID_COLUMN_WIDTH"
         assert "must be between 0 and 100" in exc.value.message
+
+
+class TestIndexKeyedRoundTrip:
+    """Tests for index-keyed fields across serialization."""
+
+    def test_json_round_trip_keeps_int_keys(self):
+        """Test index-keyed fields come back int-keyed after a JSON round trip."""
+        import json
+
+        data = {
+            "rows": [["Name", "Value"], ["Alpha", "10"]],
+            "number_format": {"1": "integer"},
+            "column_widths": {"0": "40%", "1": "60%"},
+            "highlight_rows": {"1": "blue"},
+        }
+        validated = validate_table_data(data)
+        assert validated.number_format == {1: "integer"}
+        assert validated.column_widths == {0: "40%", 1: "60%"}
+
+        dumped = json.loads(validated.model_dump_json())
+        assert validate_table_data(dumped) == validated
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Test response compression for the web server.
+
+Text responses over the size threshold are gzipped; PDF and image responses
+are always sent uncompressed.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.web_server.web_server import _MediaTypeGZipMiddleware
+
+BODY = b"x" * 4096
+
+
+def _respond(media_type):
+    async def endpoint(request):
+        return Response(content=BODY, media_type=media_type)
+
+    return endpoint
+
+
+@pytest.fixture
+def client():
+    """Create a TestClient for a small app behind the compression middleware."""
+    app = Starlette(
+        routes=[
+            Route("/html", _respond("text/html")),
+            Route("/pdf", _respond("application/pdf")),
+            Route("/png", _respond("image/png")),
+        ]
+    )
+    app.add_middleware(_MediaTypeGZipMiddleware, minimum_size=1024, compresslevel=5)
+    return TestClient(app)
+
+
+def test_text_response_is_gzipped(client):
+    """Test that a large text response is compressed"""
+    response = client.get("/html", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == BODY
+
+
+@pytest.mark.parametrize("path", ["/pdf", "/png"])
+def test_precompressed_media_is_not_gzipped(client, path):
+    """Test that PDF and image responses are sent as-is with no placeholder header"""
+    response = client.get(path, headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert int(response.headers["content-length"]) == len(BODY)
+    assert response.content == BODY
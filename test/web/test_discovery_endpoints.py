@@ -55,6 +55,20 @@ class TestPingEndpoint:
         # Validate ISO8601 format
         assert "T" in data["timestamp"]
 
+    def test_ping_repeat_requests_share_body(self, client):
+        """Test that back-to-back pings reuse the cached body"""
+        first = client.get("/ping")
+        second = client.get("/ping")
+
+        assert second.headers["content-type"] == "application/json"
+        assert second.content == first.content
+
+    def test_ping_is_not_compressed(self, client):
+        """Test that small bodies are sent uncompressed even when gzip is accepted"""
+        response = client.get("/ping", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in response.headers
+
     def test_ping_returns_service_name(self, client):
         """Test that ping endpoint returns service identifier"""
         response = client.get("/ping")
@@ -119,6 +133,30 @@ class TestTemplateListEndpoint:
             for template in filtered:
                 assert template["group"] == group
 
+    def test_list_templates_repeat_requests_match(self, client):
+        """Test that a cached listing is served identically on repeat requests"""
+        first = client.get("/templates")
+        second = client.get("/templates")
+
+        assert second.status_code == 200
+        assert second.headers["content-type"] == "application/json"
+        assert second.content == first.content
+
+    def test_list_templates_gzip_matches_identity(self, client):
+        """Test that a gzip-accepting client decodes the same listing"""
+        plain = client.get("/templates", headers={"Accept-Encoding": "identity"})
+        gzipped = client.get("/templates", headers={"Accept-Encoding": "gzip"})
+
+        assert "content-encoding" not in plain.headers
+        assert gzipped.json() == plain.json()
+
+    def test_list_templates_unknown_group_is_empty(self, client):
+        """Test that an unknown group returns an empty listing"""
+        response = client.get("/templates?group=no-such-group")
+
+        assert response.status_code == 200
+        assert response.json() == {"status": "success", "data": []}
+
 
 class TestTemplateDetailsEndpoint:
     """Test GET /templates/{template_id} endpoint"""
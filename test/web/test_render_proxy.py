@@ -156,6 +156,61 @@ class TestProxyRenderEndpoint:
         assert "<html" in html_content
         assert "Test Corp" in html_content
 
+    @pytest.mark.asyncio
+    async def test_render_content_length_counts_bytes(self, client, session_manager):
+        """Test that Content-Length is the encoded byte length of the document"""
+        result = await session_manager.create_session(
+            template_id="news_email", alias="test_render_proxy-length", group="public"
+        )
+        session_id = result.session_id
+
+        await session_manager.set_global_parameters(
+            session_id=session_id,
+            parameters={
+                "company_name": "Tést Corp",
+                "heading_title": "Market Update",
+                "email_subject": "Test Email",
+            },
+        )
+
+        response = client.post(
+            f"/render/{session_id}",
+            json={"format": "html", "style_id": "bizdark"},
+            headers={"Accept-Encoding": "identity"},
+        )
+
+        assert response.status_code == 200
+        assert int(response.headers["content-length"]) == len(response.content)
+        assert "Tést Corp" in response.text
+
+    @pytest.mark.asyncio
+    async def test_render_pdf_is_not_gzipped(self, client, session_manager):
+        """Test that PDF renders are sent uncompressed even when gzip is accepted"""
+        result = await session_manager.create_session(
+            template_id="news_email", alias="test_render_proxy-pdf-gzip", group="public"
+        )
+        session_id = result.session_id
+
+        await session_manager.set_global_parameters(
+            session_id=session_id,
+            parameters={
+                "company_name": "Test Corp",
+                "heading_title": "Market Update",
+                "email_subject": "Test Email",
+            },
+        )
+
+        response = client.post(
+            f"/render/{session_id}",
+            json={"format": "pdf", "style_id": "bizdark"},
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/pdf"
+        assert "content-encoding" not in response.headers
+        assert int(response.headers["content-length"]) == len(response.content)
+
     @pytest.mark.asyncio
     async def test_render_invalid_session_returns_404(self, client):
         """Test that rendering non-existent session returns 404"""
@@ -170,8 +225,8 @@ class TestProxyRenderEndpoint:
         assert data["detail"]["error"] == "SESSION_NOT_FOUND"
 
     @pytest.mark.asyncio
-    async def test_render_with_invalid_format_returns_400(self, client, session_manager):
-        """Test that invalid output format returns 400"""
+    async def test_render_with_invalid_format_returns_422(self, client, session_manager):
+        """Test that invalid output format is rejected at request parsing with 422"""
         # Create a minimal session
         result = await session_manager.create_session(
             template_id="news_email", alias="test_render_proxy-7", group="public"
@@ -190,7 +245,7 @@ class TestProxyRenderEndpoint:
         # Try to render with invalid format
         response = client.post(f"/render/{session_id}", json={"format": "invalid_format_xyz"})
 
-        assert response.status_code == 400
+        assert response.status_code == 422
 
 
 class TestProxyRetrievalEndpoint: